@@ -0,0 +1,207 @@
+"""
+Numba-compiled kernels for the technical indicators used by MarketTrendAnalyzer.
+
+Each kernel takes a float64 NumPy array and walks it once, carrying running
+state instead of recomputing every window. Results follow pandas'
+``rolling(window, min_periods=1)`` and ``ewm(span, adjust=False)`` semantics,
+including how NaN values are skipped.
+"""
+import functools
+
+import numpy as np
+from numba import njit
+
+# Every fast-math flag except nnan/ninf: the kernels rely on ``x == x`` NaN checks.
+_FASTMATH = {"nsz", "arcp", "contract", "afn"}
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH, error_model="numpy")
+def sma(x, n):
+    """Simple moving average over a window of ``n`` observations."""
+    size = x.shape[0]
+    out = np.empty(size)
+    total = 0.0
+    count = 0
+    for i in range(size):
+        value = x[i]
+        if value == value:
+            total += value
+            count += 1
+        if i >= n:
+            old = x[i - n]
+            if old == old:
+                total -= old
+                count -= 1
+        if count > 0:
+            out[i] = total / count
+        else:
+            total = 0.0
+            out[i] = np.nan
+    return out
+
+
+@njit(inline="always")
+def _ewm_step(weighted, old_wt, value, alpha):
+    """Advance one ``adjust=False`` EWM state by a single observation."""
+    if weighted == weighted:
+        old_wt *= 1.0 - alpha
+        if value == value:
+            if weighted != value:
+                weighted = (old_wt * weighted + alpha * value) / (old_wt + alpha)
+            old_wt = 1.0
+    elif value == value:
+        weighted = value
+    return weighted, old_wt
+
+
+@functools.cache
+def make_ema(span):
+    """
+    Return an EMA kernel specialised for ``span``.
+
+    ``alpha`` is captured as a closure constant, so it is folded into the compiled
+    loop; each span is compiled (and disk-cached) once.
+    """
+    alpha = 2.0 / (span + 1.0)
+
+    @njit(cache=True, nogil=True, fastmath=_FASTMATH, error_model="numpy")
+    def _ema(x):
+        size = x.shape[0]
+        out = np.empty(size)
+        weighted = np.nan
+        old_wt = 1.0
+        for i in range(size):
+            weighted, old_wt = _ewm_step(weighted, old_wt, x[i], alpha)
+            out[i] = weighted
+        return out
+
+    return _ema
+
+
+def ema(x, span):
+    """Exponential moving average with ``alpha = 2 / (span + 1)`` (no adjustment)."""
+    return make_ema(span)(x)
+
+
+@functools.cache
+def make_macd(fast, slow, signal):
+    """
+    Return a MACD kernel specialised for the ``(fast, slow, signal)`` spans.
+
+    The kernel keeps the three EMA states in scalars and computes the fast/slow
+    EMAs, MACD line, signal line and histogram in a single pass, returning
+    ``(ema_fast, ema_slow, macd, signal, histogram)``.
+    """
+    a_fast = 2.0 / (fast + 1.0)
+    a_slow = 2.0 / (slow + 1.0)
+    a_signal = 2.0 / (signal + 1.0)
+
+    @njit(cache=True, nogil=True, fastmath=_FASTMATH, error_model="numpy")
+    def _macd(close):
+        size = close.shape[0]
+        out_fast = np.empty(size)
+        out_slow = np.empty(size)
+        out_macd = np.empty(size)
+        out_signal = np.empty(size)
+        out_hist = np.empty(size)
+        e_fast = e_slow = e_signal = np.nan
+        w_fast = w_slow = w_signal = 1.0
+        for i in range(size):
+            value = close[i]
+            e_fast, w_fast = _ewm_step(e_fast, w_fast, value, a_fast)
+            e_slow, w_slow = _ewm_step(e_slow, w_slow, value, a_slow)
+            line = e_fast - e_slow
+            e_signal, w_signal = _ewm_step(e_signal, w_signal, line, a_signal)
+            out_fast[i] = e_fast
+            out_slow[i] = e_slow
+            out_macd[i] = line
+            out_signal[i] = e_signal
+            out_hist[i] = line - e_signal
+        return out_fast, out_slow, out_macd, out_signal, out_hist
+
+    return _macd
+
+
+def macd(close, fast, slow, signal):
+    """Fast/slow EMAs, MACD line, signal line and histogram in a single pass."""
+    return make_macd(fast, slow, signal)(close)
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH, error_model="numpy")
+def rsi(close, n):
+    """Relative Strength Index using simple moving averages of gains and losses."""
+    size = close.shape[0]
+    out = np.empty(size)
+    gains = np.zeros(size)
+    losses = np.zeros(size)
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(size):
+        if i > 0:
+            delta = close[i] - close[i - 1]
+            if delta > 0:
+                gains[i] = delta
+            elif delta < 0:
+                losses[i] = -delta
+        gain_sum += gains[i]
+        loss_sum += losses[i]
+        count = i + 1
+        if i >= n:
+            gain_sum -= gains[i - n]
+            loss_sum -= losses[i - n]
+            count = n
+        rs = (gain_sum / count) / (loss_sum / count)
+        out[i] = 100.0 - 100.0 / (1.0 + rs)
+    return out
+
+
+@njit(cache=True, nogil=True, fastmath=_FASTMATH, error_model="numpy")
+def rolling_std(x, n):
+    """
+    Rolling sample standard deviation (ddof=1) over a window of ``n`` observations.
+
+    Uses Welford's update to add the incoming value and remove the outgoing one,
+    so each step is O(1) and constant windows come out as exactly 0.
+    """
+    size = x.shape[0]
+    out = np.empty(size)
+    mean = 0.0
+    m2 = 0.0
+    count = 0
+    for i in range(size):
+        value = x[i]
+        if value == value:
+            count += 1
+            delta = value - mean
+            mean += delta / count
+            m2 += delta * (value - mean)
+        if i >= n:
+            old = x[i - n]
+            if old == old:
+                count -= 1
+                if count > 0:
+                    delta = old - mean
+                    mean -= delta / count
+                    m2 -= delta * (old - mean)
+                else:
+                    mean = 0.0
+                    m2 = 0.0
+        if count > 1:
+            var = m2 / (count - 1)
+            out[i] = np.sqrt(var) if var > 0.0 else 0.0
+        else:
+            out[i] = np.nan
+    return out
+
+
+def _warmup():
+    """Compile (or load from cache) every kernel so the first real call is not penalised."""
+    dummy = np.linspace(1.0, 2.0, 64)
+    sma(dummy, 20)
+    ema(dummy, 12)
+    macd(dummy, 12, 26, 9)
+    rsi(dummy, 14)
+    rolling_std(dummy, 20)
+
+
+_warmup()
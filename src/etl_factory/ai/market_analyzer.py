@@ -1,41 +1,125 @@
 """
 GenAI-powered Market Trend Analyzer and Investment Recommendation System.
 """
+import asyncio
+import hashlib
+import json
+import logging
 import os
-from typing import Dict, List, Any, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 
+from etl_factory.ai import indicators_nb
+from etl_factory.ai.streaming import StreamingIndicators
+
+logger = logging.getLogger(__name__)
+
+_SYSTEM_PROMPT = "You are a financial market analyst with expertise in technical analysis and investment strategies."
+
+# Alternative strategies suggested alongside every recommendation; each result gets its own copies
+_ALTERNATIVES = (
+    {
+        "strategy": "Index Funds (S&P 500, NASDAQ)",
+        "risk": "Low-Medium",
+        "expected_return": "7-10% annually",
+        "rationale": "Diversified exposure with lower volatility"
+    },
+    {
+        "strategy": "Bond ETFs",
+        "risk": "Low",
+        "expected_return": "3-5% annually",
+        "rationale": "Stable income with capital preservation"
+    },
+    {
+        "strategy": "Dividend Stocks",
+        "risk": "Medium",
+        "expected_return": "4-7% annually",
+        "rationale": "Regular income with potential capital appreciation"
+    },
+)
+
+
+def _utc_timestamps(values: pd.Series) -> pd.Series:
+    """
+    Parse bar timestamps into UTC.
+    
+    The Polygon operator's DataFrame rows carry UTC timestamps; its list rows are
+    naive ISO strings in local time (as written by ``datetime.fromtimestamp``), so
+    naive values are localized through the OS time zone before conversion.
+    """
+    parsed = pd.to_datetime(values, format="ISO8601") if values.dtype == object else pd.to_datetime(values)
+    if parsed.dt.tz is not None:
+        return parsed.dt.tz_convert("UTC")
+    # UTC offsets only change a few times a year, so resolve each distinct hour once
+    hours = parsed.dt.floor("h")
+    offsets = {
+        hour: pd.Timedelta(hour.to_pydatetime().astimezone().utcoffset())
+        for hour in hours.dropna().unique()
+    }
+    return (parsed - hours.map(offsets)).dt.tz_localize("UTC")
+
+
+def _parse_analyses(response: str) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Parse a batched LLM reply into its per-ticker entries.
+    
+    Returns:
+        Entries keyed by ticker, or None if the reply is not a complete
+        {"analyses": [...]} object (e.g. cut off at max_tokens)
+    """
+    try:
+        payload = json.loads(response[response.index("{"):response.rindex("}") + 1])
+        return {entry["ticker"]: entry for entry in payload["analyses"]}
+    except (ValueError, KeyError, TypeError):
+        return None
+
 
 class MarketTrendAnalyzer:
     """
     GenAI-powered analyzer for stock market trends and investment recommendations.
     """
     
-    def __init__(self, llm_provider: str = "openai", api_key: Optional[str] = None):
+    def __init__(self, llm_provider: str = "openai", api_key: Optional[str] = None,
+                 cache_dir: Optional[str] = "~/.cache/market_llm", cache_size: int = 1024,
+                 cache_ttl: int = 24 * 60 * 60):
         """
         Initialize the Market Trend Analyzer.
         
         Args:
-            llm_provider: LLM provider ("openai", "anthropic", "local")
+            llm_provider: LLM provider ("openai", "anthropic", "gemini", "local")
             api_key: API key for the LLM provider
+            cache_dir: Directory for the persistent LLM response cache (None disables it)
+            cache_size: Maximum number of LLM responses kept in memory
+            cache_ttl: Seconds a persisted LLM response stays valid
         """
         self.llm_provider = llm_provider
         self.api_key = api_key or os.getenv("OPENAI_API_KEY") or os.getenv("ANTHROPIC_API_KEY") or os.getenv("GEMINI_API_KEY")
         self.llm_client = self._initialize_llm()
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+        # The async path and caller threads share the in-memory LRU
+        self._response_cache_lock = threading.Lock()
+        self._disk_cache = self._initialize_disk_cache(cache_dir) if self.llm_client else None
+        self._streaming: Dict[str, StreamingIndicators] = {}
     
     def _initialize_llm(self):
         """Initialize the LLM client based on provider."""
         if self.llm_provider == "openai":
             try:
                 import openai
-                if self.api_key:
-                    openai.api_key = self.api_key
-                return openai
+                return openai.OpenAI(api_key=self.api_key) if self.api_key else openai.OpenAI()
             except ImportError:
                 print("Warning: openai package not installed. Install with: pip install openai")
                 return None
+            except openai.OpenAIError as e:
+                print(f"Warning: could not initialize OpenAI client: {e}")
+                return None
         elif self.llm_provider == "anthropic":
             try:
                 import anthropic
@@ -45,13 +129,23 @@ class MarketTrendAnalyzer:
                 return None
         elif self.llm_provider == "gemini":
             try:
-                if self.api_key:
-                    os.environ["GEMINI_API_KEY"] = self.api_key
-                    from google import genai
-                    client = genai.Client()
-                return client
+                from google import genai
+                from google.genai import types
+                # Built once and reused by every request; thinking is disabled
+                self._gemini_cfg = types.GenerateContentConfig(
+                    system_instruction=_SYSTEM_PROMPT,
+                    temperature=0.3,
+                    thinking_config=types.ThinkingConfig(thinking_budget=0)
+                )
+                self._gemini_json_cfg = self._gemini_cfg.model_copy(
+                    update={"response_mime_type": "application/json"}
+                )
+                return genai.Client(api_key=self.api_key) if self.api_key else genai.Client()
             except ImportError:
-                print("Warning: google-gemini package not installed. Install with: pip install google-gemini")
+                print("Warning: google-genai package not installed. Install with: pip install google-genai")
+                return None
+            except ValueError as e:
+                print(f"Warning: could not initialize Gemini client: {e}")
                 return None
         else:
             return None
@@ -64,56 +158,84 @@ class MarketTrendAnalyzer:
             df: DataFrame with columns: timestamp, open, high, low, close, volume
             
         Returns:
-            DataFrame with additional technical indicator columns
+            DataFrame with additional technical indicator columns (float32) and a
+            categorical trend column
         """
         if df.empty:
             return df
         
         # Ensure proper data types
-        df['close'] = pd.to_numeric(df['close'], errors='coerce')
-        df['volume'] = pd.to_numeric(df['volume'], errors='coerce')
-        df['high'] = pd.to_numeric(df['high'], errors='coerce')
-        df['low'] = pd.to_numeric(df['low'], errors='coerce')
+        for col in ('close', 'volume', 'high', 'low'):
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                df[col] = pd.to_numeric(df[col], errors='coerce')
         
         # Sort by timestamp
         df = df.sort_values('timestamp').reset_index(drop=True)
         
+        # Extract the raw columns once and compute every indicator on arrays
+        close = df['close'].to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
+
         # Moving Averages
-        df['sma_20'] = df['close'].rolling(window=20, min_periods=1).mean()
-        df['sma_50'] = df['close'].rolling(window=50, min_periods=1).mean()
-        df['ema_12'] = df['close'].ewm(span=12, adjust=False).mean()
-        df['ema_26'] = df['close'].ewm(span=26, adjust=False).mean()
-        
-        # MACD
-        df['macd'] = df['ema_12'] - df['ema_26']
-        df['macd_signal'] = df['macd'].ewm(span=9, adjust=False).mean()
-        df['macd_histogram'] = df['macd'] - df['macd_signal']
-        
-        # RSI (Relative Strength Index)
-        delta = df['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=14, min_periods=1).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=14, min_periods=1).mean()
-        rs = gain / loss
-        df['rsi'] = 100 - (100 / (1 + rs))
-        
-        # Bollinger Bands
-        df['bb_middle'] = df['close'].rolling(window=20, min_periods=1).mean()
-        bb_std = df['close'].rolling(window=20, min_periods=1).std()
-        df['bb_upper'] = df['bb_middle'] + (bb_std * 2)
-        df['bb_lower'] = df['bb_middle'] - (bb_std * 2)
-        
+        sma_20 = indicators_nb.sma(close, 20)
+        sma_50 = indicators_nb.sma(close, 50)
+
+        # EMAs and MACD share one fused pass over close
+        ema_12, ema_26, macd, macd_signal, macd_histogram = indicators_nb.macd(close, 12, 26, 9)
+
+        # Bollinger Bands (the middle band is the 20-period SMA already computed)
+        bb_std = indicators_nb.rolling_std(close, 20)
+        bb_upper = sma_20 + bb_std * 2
+        bb_lower = sma_20 - bb_std * 2
+
         # Volume indicators
-        df['volume_sma'] = df['volume'].rolling(window=20, min_periods=1).mean()
-        df['volume_ratio'] = df['volume'] / df['volume_sma']
-        
+        volume_sma = indicators_nb.sma(volume, 20)
+
         # Price change indicators
-        df['price_change'] = df['close'].pct_change()
-        df['volatility'] = df['price_change'].rolling(window=20, min_periods=1).std()
+        price_change = np.empty_like(close)
+        price_change[:1] = np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_ratio = volume / volume_sma
+            np.divide(np.diff(close), close[:-1], out=price_change[1:])
+
+        indicators = dict(
+            sma_20=sma_20,
+            sma_50=sma_50,
+            ema_12=ema_12,
+            ema_26=ema_26,
+            macd=macd,
+            macd_signal=macd_signal,
+            macd_histogram=macd_histogram,
+            rsi=indicators_nb.rsi(close, 14),  # RSI (Relative Strength Index)
+            bb_middle=sma_20,
+            bb_upper=bb_upper,
+            bb_lower=bb_lower,
+            volume_sma=volume_sma,
+            volume_ratio=volume_ratio,
+            price_change=price_change,
+            volatility=indicators_nb.rolling_std(price_change, 20),
+        )
+        # float32 halves the frame; the recommendation thresholds don't need float64 precision
+        df = df.assign(**{name: values.astype(np.float32) for name, values in indicators.items()})
         
         # Trend indicators
-        df['trend'] = 'neutral'
-        df.loc[df['close'] > df['sma_20'], 'trend'] = 'bullish'
-        df.loc[df['close'] < df['sma_20'], 'trend'] = 'bearish'
+        diff = close - sma_20
+        trend = np.where(diff > 0, 'bullish', np.where(diff < 0, 'bearish', 'neutral'))
+        df['trend'] = pd.Categorical(trend, categories=['bearish', 'neutral', 'bullish'])
+        
+        # Last-row values taken straight from the arrays, so summaries don't box a pandas row
+        last = len(df) - 1
+        df.attrs['snapshot'] = {
+            'rows': len(df),
+            'last_index': df.index[last],
+            'reference_close': float(close[max(0, last - 29)]),
+            'latest': {
+                'close': float(close[last]),
+                **{name: float(indicators[name][last])
+                   for name in ('sma_20', 'sma_50', 'macd', 'rsi', 'bb_upper', 'bb_lower', 'volatility')},
+                'trend': str(trend[last])
+            }
+        }
         
         return df
     
@@ -138,12 +260,39 @@ class MarketTrendAnalyzer:
                 "confidence": 0.0
             }
         
-        latest = technical_indicators.iloc[-1]
-        recent_data = technical_indicators.tail(30)
+        summary = self._summarize_indicators(ticker, technical_indicators)
+        
+        # Get LLM analysis
+        llm_analysis = self._get_llm_analysis(summary["prompt"])
         
+        return self._build_market_insights(summary, llm_analysis)
+    
+    def _summarize_indicators(self, ticker: str, technical_indicators: pd.DataFrame) -> Dict[str, Any]:
+        """Extract the key metrics for a ticker and build its LLM prompt."""
+        snapshot = technical_indicators.attrs.get('snapshot')
+        if self._snapshot_matches(snapshot, technical_indicators):
+            latest = snapshot['latest']
+            reference_close = snapshot['reference_close']
+        else:
+            # Frame not produced (or since reshaped or edited) by calculate_technical_indicators
+            latest = technical_indicators.iloc[-1].to_dict()
+            reference_close = technical_indicators.tail(30).iloc[0]['close']
+        return self._summarize_latest(ticker, latest, reference_close)
+    
+    @staticmethod
+    def _snapshot_matches(snapshot: Optional[Dict[str, Any]], df: pd.DataFrame) -> bool:
+        """Check a cached snapshot still describes the frame's last row."""
+        if snapshot is None or snapshot['rows'] != len(df):
+            return False
+        # attrs survive slicing and in-place edits, so also compare the last row itself
+        return (df.index[-1] == snapshot['last_index']
+                and float(df['close'].iloc[-1]) == snapshot['latest']['close'])
+    
+    def _summarize_latest(self, ticker: str, latest: Dict[str, Any], reference_close: float) -> Dict[str, Any]:
+        """Build a ticker's summary and LLM prompt from its last-row indicator values."""
         # Calculate key metrics
         current_price = float(latest['close'])
-        price_change_30d = ((current_price - recent_data.iloc[0]['close']) / recent_data.iloc[0]['close']) * 100
+        price_change_30d = ((current_price - reference_close) / reference_close) * 100
         volatility = float(latest['volatility']) * 100 if 'volatility' in latest else 0
         rsi = float(latest['rsi']) if 'rsi' in latest else 50
         trend = latest.get('trend', 'neutral')
@@ -156,28 +305,43 @@ class MarketTrendAnalyzer:
             volatility=volatility,
             rsi=rsi,
             trend=trend,
-            technical_data=latest.to_dict()
-        )
-        
-        # Get LLM analysis
-        llm_analysis = self._get_llm_analysis(prompt)
-        
-        # Generate recommendation
-        recommendation = self._generate_recommendation(
-            rsi=rsi,
-            trend=trend,
-            price_change=price_change_30d,
-            volatility=volatility,
-            llm_insights=llm_analysis
+            technical_data=latest
         )
         
         return {
             "ticker": ticker,
+            "latest": latest,
             "current_price": current_price,
             "price_change_30d": price_change_30d,
             "volatility": volatility,
             "rsi": rsi,
             "trend": trend,
+            "prompt": prompt
+        }
+    
+    def _build_market_insights(self, summary: Dict[str, Any], llm_analysis: str,
+                               recommendation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Combine the indicator summary, LLM analysis and recommendation into the final insights."""
+        latest = summary["latest"]
+        rsi = summary["rsi"]
+        
+        # Generate recommendation
+        if recommendation is None:
+            recommendation = self._generate_recommendation(
+                rsi=rsi,
+                trend=summary["trend"],
+                price_change=summary["price_change_30d"],
+                volatility=summary["volatility"],
+                llm_insights=llm_analysis
+            )
+        
+        return {
+            "ticker": summary["ticker"],
+            "current_price": summary["current_price"],
+            "price_change_30d": summary["price_change_30d"],
+            "volatility": summary["volatility"],
+            "rsi": rsi,
+            "trend": summary["trend"],
             "technical_summary": {
                 "sma_20": float(latest.get('sma_20', 0)),
                 "sma_50": float(latest.get('sma_50', 0)),
@@ -197,9 +361,26 @@ class MarketTrendAnalyzer:
                                price_change_30d: float, volatility: float,
                                rsi: float, trend: str, technical_data: Dict) -> str:
         """Create prompt for LLM analysis."""
+        market_data = self._format_market_data(current_price, price_change_30d, volatility,
+                                               rsi, trend, technical_data)
         return f"""Analyze the following stock market data for {ticker} and provide investment insights:
 
-Current Price: ${current_price:.2f}
+{market_data}
+
+Please provide:
+1. Market trend analysis (bullish, bearish, or neutral)
+2. Entry recommendation (BUY, SELL, or WAIT)
+3. Suggested holding period (short-term: 1-7 days, medium-term: 1-4 weeks, long-term: 1+ months)
+4. Risk assessment
+5. Alternative investment strategies for safer gains (bonds, ETFs, index funds, etc.)
+
+Format your response as a structured analysis with clear recommendations."""
+    
+    def _format_market_data(self, current_price: float, price_change_30d: float,
+                            volatility: float, rsi: float, trend: str,
+                            technical_data: Dict) -> str:
+        """Format a ticker's metrics and technical indicators for an LLM prompt."""
+        return f"""Current Price: ${current_price:.2f}
 30-Day Price Change: {price_change_30d:.2f}%
 Volatility: {volatility:.2f}%
 RSI (Relative Strength Index): {rsi:.2f}
@@ -209,61 +390,241 @@ Technical Indicators:
 - SMA 20: ${technical_data.get('sma_20', 0):.2f}
 - SMA 50: ${technical_data.get('sma_50', 0):.2f}
 - MACD: {technical_data.get('macd', 0):.4f}
-- Bollinger Bands Position: {self._get_bb_position(technical_data)}
+- Bollinger Bands Position: {self._get_bb_position(technical_data)}"""
+    
+    def _create_batched_analysis_prompt(self, tickers_data: List[Dict[str, Any]]) -> str:
+        """Create a single prompt asking for a structured analysis of several tickers."""
+        blocks = "\n\n".join(
+            f"""{i}. {data['ticker']}
+{self._format_market_data(data['current_price'], data['price_change_30d'], data['volatility'],
+                          data['rsi'], data['trend'], data['latest'])}"""
+            for i, data in enumerate(tickers_data, start=1)
+        )
+        return f"""Analyze the following stock market data for {len(tickers_data)} tickers and provide investment insights for each.
 
-Please provide:
-1. Market trend analysis (bullish, bearish, or neutral)
-2. Entry recommendation (BUY, SELL, or WAIT)
-3. Suggested holding period (short-term: 1-7 days, medium-term: 1-4 weeks, long-term: 1+ months)
-4. Risk assessment
-5. Alternative investment strategies for safer gains (bonds, ETFs, index funds, etc.)
+Respond with a JSON object of the form {{"analyses": [...]}} containing one object per ticker, in the order given, with these keys:
+- "ticker": the ticker symbol
+- "trend": market trend analysis (bullish, bearish, or neutral)
+- "action": entry recommendation (BUY, SELL, or WAIT)
+- "holding_period": suggested holding period (short-term: 1-7 days, medium-term: 1-4 weeks, long-term: 1+ months)
+- "risk": risk assessment
+- "alternatives": alternative investment strategies for safer gains (bonds, ETFs, index funds, etc.)
+- "analysis": a brief structured analysis
 
-Format your response as a structured analysis with clear recommendations."""
+{blocks}"""
+    
+    def _parse_batched_analysis(self, response: str, tickers: List[str]) -> Dict[str, str]:
+        """Split a batched LLM response into per-ticker insights."""
+        by_ticker = _parse_analyses(response)
+        if by_ticker is None:
+            # Never hand one ticker the raw reply, which holds the other tickers' analysis;
+            # status messages (LLM not configured, request failed) are passed through
+            if response.startswith("LLM "):
+                return {ticker: response for ticker in tickers}
+            return {ticker: "LLM analysis unavailable: malformed batched response" for ticker in tickers}
+        
+        insights = {}
+        for ticker in tickers:
+            entry = by_ticker.get(ticker)
+            if entry is None:
+                insights[ticker] = "LLM analysis unavailable: ticker missing from batched response"
+                continue
+            insights[ticker] = "\n".join(
+                f"{key.replace('_', ' ').title()}: {value}"
+                for key, value in entry.items() if key != "ticker"
+            )
+        return insights
     
-    def _get_llm_analysis(self, prompt: str) -> str:
-        """Get analysis from LLM."""
+    def _get_llm_analysis(self, prompt: str, json_mode: bool = False, max_tokens: int = 1000) -> str:
+        """Get analysis from LLM, serving repeated prompts from the response cache."""
         if not self.llm_client:
             return "LLM not configured. Using rule-based analysis only."
         
+        key = self._cache_key(prompt)
+        cached = self._get_cached_analysis(key)
+        if cached is not None and self._is_valid_analysis(cached, json_mode):
+            return cached
+        
         try:
-            if self.llm_provider == "openai":
-                from openai import OpenAI
-                client = OpenAI(api_key=self.api_key) if self.api_key else OpenAI()
-                response = client.chat.completions.create(
-                    model="gpt-4o",
-                    messages=[
-                        {"role": "system", "content": "You are a financial market analyst with expertise in technical analysis and investment strategies."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.3,
-                    max_tokens=1000
-                )
-                return response.choices[0].message.content
-            elif self.llm_provider == "anthropic":
-                message = self.llm_client.messages.create(
-                    model="claude-3-sonnet-20240229",
-                    max_tokens=1000,
-                    temperature=0.3,
-                    system="You are a financial market analyst with expertise in technical analysis and investment strategies.",
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                return message.content[0].text
-            elif self.llm_provider == "gemini":
-                from google.genai import types
-
-                response = self.llm_client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents="How does AI work?",
-                    config=types.GenerateContentConfig(
-                        thinking_config=types.ThinkingConfig(thinking_budget=0) # Disables thinking
-                    ),
-                )
-                print(response.text)
+            analysis = self._query_llm(prompt, json_mode=json_mode, max_tokens=max_tokens)
         except Exception as e:
-            print(f"Error getting LLM analysis: {e}")
+            logger.warning("Error getting LLM analysis: %s", e)
             return f"LLM analysis unavailable: {str(e)}"
         
-        return "LLM analysis unavailable"
+        return self._accept_analysis(key, analysis, json_mode)
+    
+    @staticmethod
+    def _is_valid_analysis(analysis: str, json_mode: bool) -> bool:
+        """Check a JSON-mode reply parses into the batched analyses payload."""
+        return not json_mode or _parse_analyses(analysis) is not None
+    
+    def _accept_analysis(self, key: str, analysis: Optional[str], json_mode: bool) -> str:
+        """Cache a fresh LLM reply if it is usable, returning what callers should see."""
+        if analysis is None:
+            return "LLM analysis unavailable"
+        if not self._is_valid_analysis(analysis, json_mode):
+            # Truncated or non-JSON replies are not cached, so the next run asks again
+            logger.warning("Discarding malformed JSON LLM response (%d chars)", len(analysis))
+            return "LLM analysis unavailable: malformed JSON response"
+        self._store_analysis(key, analysis)
+        return analysis
+    
+    def _query_llm(self, prompt: str, json_mode: bool = False, max_tokens: int = 1000) -> Optional[str]:
+        """Send a prompt to the configured LLM provider."""
+        if self.llm_provider == "openai":
+            response = self.llm_client.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {"role": "system", "content": _SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=max_tokens,
+                **({"response_format": {"type": "json_object"}} if json_mode else {})
+            )
+            return response.choices[0].message.content
+        elif self.llm_provider == "anthropic":
+            message = self.llm_client.messages.create(
+                model="claude-3-sonnet-20240229",
+                max_tokens=max_tokens,
+                temperature=0.3,
+                system=_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return message.content[0].text
+        elif self.llm_provider == "gemini":
+            response = self.llm_client.models.generate_content(
+                model="gemini-2.5-flash",
+                contents=prompt,
+                config=self._gemini_json_cfg if json_mode else self._gemini_cfg
+            )
+            return response.text
+        return None
+    
+    def _initialize_disk_cache(self, cache_dir: Optional[str]):
+        """Open the persistent LLM response cache, if enabled."""
+        if not cache_dir:
+            return None
+        try:
+            from diskcache import Cache
+            return Cache(os.path.expanduser(cache_dir))
+        except ImportError:
+            print("Warning: diskcache package not installed. LLM responses will only be cached in memory. Install with: pip install diskcache")
+            return None
+    
+    def _cache_key(self, prompt: str) -> str:
+        """Hash the provider and prompt into a response cache key."""
+        return hashlib.blake2b(f"{self.llm_provider}\n{prompt}".encode(), digest_size=16).hexdigest()
+    
+    def _get_cached_analysis(self, key: str) -> Optional[str]:
+        """Look up a cached LLM response in memory, then on disk."""
+        with self._response_cache_lock:
+            if key in self._response_cache:
+                self._response_cache.move_to_end(key)
+                return self._response_cache[key]
+        if self._disk_cache is not None:
+            analysis = self._disk_cache.get(key)
+            if analysis is not None:
+                self._store_analysis(key, analysis, persist=False)
+            return analysis
+        return None
+    
+    def _store_analysis(self, key: str, analysis: str, persist: bool = True):
+        """Cache a successful LLM response, evicting the least recently used entry."""
+        with self._response_cache_lock:
+            self._response_cache[key] = analysis
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > self.cache_size:
+                self._response_cache.popitem(last=False)
+        if persist and self._disk_cache is not None:
+            self._disk_cache.set(key, analysis, expire=self.cache_ttl)
+    
+    def _initialize_async_llm(self):
+        """Initialize an async LLM client, for providers that offer one."""
+        if self.llm_provider == "openai":
+            import httpx
+            from openai import AsyncOpenAI
+            # One pooled connection set shared by every concurrent request of a run
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+            )
+            return AsyncOpenAI(api_key=self.llm_client.api_key, http_client=http_client)
+        elif self.llm_provider == "anthropic":
+            import anthropic
+            return anthropic.AsyncAnthropic(api_key=self.api_key)
+        elif self.llm_provider == "gemini":
+            return self.llm_client.aio
+        return None
+    
+    async def _get_llm_analysis_async(self, prompt: str, async_client,
+                                      json_mode: bool = False, max_tokens: int = 1000) -> str:
+        """Get analysis from LLM without blocking the event loop."""
+        if async_client is None:
+            return "LLM not configured. Using rule-based analysis only."
+        
+        key = self._cache_key(prompt)
+        cached = self._get_cached_analysis(key)
+        if cached is not None and self._is_valid_analysis(cached, json_mode):
+            return cached
+        
+        try:
+            analysis = await self._query_llm_async(prompt, async_client, json_mode=json_mode, max_tokens=max_tokens)
+        except Exception as e:
+            logger.warning("Error getting LLM analysis: %s", e)
+            return f"LLM analysis unavailable: {str(e)}"
+        
+        return self._accept_analysis(key, analysis, json_mode)
+    
+    async def _query_llm_async(self, prompt: str, async_client,
+                               json_mode: bool = False, max_tokens: int = 1000) -> Optional[str]:
+        """Send a prompt to the configured LLM provider through its async client."""
+        if self.llm_provider == "openai":
+            response = await async_client.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {"role": "system", "content": _SYSTEM_PROMPT},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=max_tokens,
+                **({"response_format": {"type": "json_object"}} if json_mode else {})
+            )
+            return response.choices[0].message.content
+        elif self.llm_provider == "anthropic":
+            message = await async_client.messages.create(
+                model="claude-3-sonnet-20240229",
+                max_tokens=max_tokens,
+                temperature=0.3,
+                system=_SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            return message.content[0].text
+        elif self.llm_provider == "gemini":
+            response = await async_client.models.generate_content(
+                model="gemini-2.5-flash",
+                contents=prompt,
+                config=self._gemini_json_cfg if json_mode else self._gemini_cfg
+            )
+            return response.text
+        return None
+    
+    async def _get_llm_analyses_async(self, prompts: List[str], json_mode: bool = False,
+                                      max_tokens: int = 1000) -> List[str]:
+        """Run the LLM analysis for every prompt concurrently over one shared client."""
+        async_client = self._initialize_async_llm() if self.llm_client else None
+        try:
+            responses = await asyncio.gather(
+                *(self._get_llm_analysis_async(prompt, async_client, json_mode, max_tokens) for prompt in prompts),
+                return_exceptions=True
+            )
+        finally:
+            # Gemini's async client is a view of the sync client and is not ours to close
+            if async_client is not None and self.llm_provider != "gemini":
+                await async_client.close()
+        return [
+            f"LLM analysis unavailable: {str(r)}" if isinstance(r, Exception) else r
+            for r in responses
+        ]
     
     def _get_bb_position(self, data: Dict) -> str:
         """Get Bollinger Bands position."""
@@ -283,100 +644,131 @@ Format your response as a structured analysis with clear recommendations."""
                                 price_change: float, volatility: float,
                                 llm_insights: str) -> Dict[str, Any]:
         """Generate investment recommendation based on technical analysis and LLM insights."""
+        return self._generate_recommendations([rsi], [trend], [price_change], [volatility])[0]
+    
+    def _generate_recommendations(self, rsi, trend, price_change, volatility) -> List[Dict[str, Any]]:
+        """
+        Generate recommendations for many tickers at once.
+        
+        The rule-based scoring is evaluated over arrays with ``np.select`` instead of
+        branching per ticker.
+        
+        Args:
+            rsi: RSI value per ticker
+            trend: Trend label ("bullish", "bearish", "neutral") per ticker
+            price_change: 30-day price change (%) per ticker
+            volatility: Volatility (%) per ticker
+            
+        Returns:
+            List of recommendation dictionaries, in input order
+        """
+        rsi = np.asarray(rsi, dtype=np.float64)
+        trend = np.asarray(trend, dtype=object)
+        price_change = np.asarray(price_change, dtype=np.float64)
+        volatility = np.asarray(volatility, dtype=np.float64)
         
         # Rule-based recommendation logic
-        recommendation_score = 0
-        confidence = 0.5
-        
-        # RSI analysis
-        if rsi < 30:
-            recommendation_score += 2  # Oversold, potential buy
-        elif rsi > 70:
-            recommendation_score -= 2  # Overbought, potential sell
-        elif 30 <= rsi <= 50:
-            recommendation_score += 1  # Neutral to slightly bullish
-        
-        # Trend analysis
-        if trend == "bullish":
-            recommendation_score += 1
-        elif trend == "bearish":
-            recommendation_score -= 1
-        
-        # Price change analysis
-        if price_change > 5:
-            recommendation_score -= 1  # May be overvalued
-        elif price_change < -5:
-            recommendation_score += 1  # May be undervalued
-        
-        # Volatility consideration
-        if volatility > 3:
-            confidence -= 0.2  # High volatility reduces confidence
+        recommendation_score = (
+            # RSI: oversold -> buy, overbought -> sell, neutral to slightly bullish
+            np.select([rsi < 30, rsi > 70, rsi <= 50], [2, -2, 1], default=0)
+            # Trend analysis
+            + np.select([trend == "bullish", trend == "bearish"], [1, -1], default=0)
+            # Price change: may be overvalued / undervalued
+            + np.select([price_change > 5, price_change < -5], [-1, 1], default=0)
+        )
+        
+        # High volatility reduces confidence
+        confidence = np.where(volatility > 3, 0.3, 0.5)
         
         # Determine action
-        if recommendation_score >= 2:
-            action = "BUY"
-            confidence = min(0.9, confidence + 0.2)
-            holding_period = "medium-term (1-4 weeks)" if volatility < 2 else "short-term (1-7 days)"
-        elif recommendation_score <= -2:
-            action = "SELL"
-            confidence = min(0.9, confidence + 0.2)
-            holding_period = "immediate"
-        else:
-            action = "WAIT"
-            confidence = 0.6
-            holding_period = "monitor for 1-2 weeks"
+        buy = recommendation_score >= 2
+        sell = recommendation_score <= -2
+        action = np.select([buy, sell], ["BUY", "SELL"], default="WAIT")
+        confidence = np.where(buy | sell, np.minimum(0.9, confidence + 0.2), 0.6).round(2)
+        holding_period = np.select(
+            [buy & (volatility < 2), buy, sell],
+            ["medium-term (1-4 weeks)", "short-term (1-7 days)", "immediate"],
+            default="monitor for 1-2 weeks"
+        )
         
-        # Alternative strategies
-        alternatives = [
+        return [
             {
-                "strategy": "Index Funds (S&P 500, NASDAQ)",
-                "risk": "Low-Medium",
-                "expected_return": "7-10% annually",
-                "rationale": "Diversified exposure with lower volatility"
-            },
-            {
-                "strategy": "Bond ETFs",
-                "risk": "Low",
-                "expected_return": "3-5% annually",
-                "rationale": "Stable income with capital preservation"
-            },
-            {
-                "strategy": "Dividend Stocks",
-                "risk": "Medium",
-                "expected_return": "4-7% annually",
-                "rationale": "Regular income with potential capital appreciation"
+                "action": str(action[i]),
+                "confidence": float(confidence[i]),
+                "holding_period": str(holding_period[i]),
+                "alternatives": [dict(alternative) for alternative in _ALTERNATIVES],
+                "reasoning": f"RSI: {rsi[i]:.1f}, Trend: {trend[i]}, Price Change: {price_change[i]:.2f}%"
             }
+            for i in range(len(action))
         ]
-        
-        return {
-            "action": action,
-            "confidence": round(confidence, 2),
-            "holding_period": holding_period,
-            "alternatives": alternatives,
-            "reasoning": f"RSI: {rsi:.1f}, Trend: {trend}, Price Change: {price_change:.2f}%"
-        }
     
-    def analyze_multiple_stocks(self, stock_data_dict: Dict[str, List[Dict]]) -> Dict[str, Any]:
+    def analyze_multiple_stocks(self, stock_data_dict: Dict[str, Union[List[Dict], pd.DataFrame]],
+                                batch_size: int = 10, incremental: bool = False) -> Dict[str, Any]:
         """
         Analyze multiple stocks and provide portfolio-level insights.
         
+        Tickers are packed ``batch_size`` at a time into a single LLM prompt and the
+        batches are requested concurrently; use ``aanalyze_multiple_stocks`` when
+        already inside an event loop.
+        
         Args:
-            stock_data_dict: Dictionary mapping ticker to stock data list
+            stock_data_dict: Dictionary mapping ticker to stock data list or DataFrame
+            batch_size: Maximum number of tickers per LLM prompt (1 disables batching)
+            incremental: Keep per-ticker indicator state between calls and only apply
+                bars newer than the previous call (for repeated intraday polling)
             
         Returns:
             Dictionary with portfolio analysis and recommendations
         """
-        analyses = {}
+        return asyncio.run(self.aanalyze_multiple_stocks(stock_data_dict, batch_size=batch_size,
+                                                         incremental=incremental))
+    
+    async def aanalyze_multiple_stocks(self, stock_data_dict: Dict[str, Union[List[Dict], pd.DataFrame]],
+                                       batch_size: int = 10, incremental: bool = False) -> Dict[str, Any]:
+        """
+        Async variant of ``analyze_multiple_stocks``.
         
-        for ticker, data in stock_data_dict.items():
-            if not data:
-                continue
+        Args:
+            stock_data_dict: Dictionary mapping ticker to stock data list or DataFrame
+            batch_size: Maximum number of tickers per LLM prompt (1 disables batching)
+            incremental: Keep per-ticker indicator state between calls and only apply
+                bars newer than the previous call
             
-            df = pd.DataFrame(data)
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df = self.calculate_technical_indicators(df)
-            analysis = self.generate_market_insights(ticker, data, df)
-            analyses[ticker] = analysis
+        Returns:
+            Dictionary with portfolio analysis and recommendations
+        """
+        stock_data = {
+            ticker: data for ticker, data in stock_data_dict.items()
+            if data is not None and len(data) > 0
+        }
+        
+        # Tickers are independent and the indicator kernels release the GIL; the pool is
+        # awaited so the event loop keeps running while the indicators are calculated
+        summarize = self._streaming_summary if incremental else self._ticker_summary
+        summaries = []
+        if stock_data:
+            loop = asyncio.get_running_loop()
+            executor = ThreadPoolExecutor(max_workers=min(len(stock_data), os.cpu_count() or 1))
+            try:
+                summaries = await asyncio.gather(*(
+                    loop.run_in_executor(executor, summarize, ticker, data)
+                    for ticker, data in stock_data.items()
+                ))
+            finally:
+                # Joining the workers would block the loop; they exit once their tasks are done
+                executor.shutdown(wait=False)
+        
+        llm_insights = await self._get_portfolio_llm_insights(summaries, batch_size)
+        recommendations = self._generate_recommendations(
+            rsi=[summary["rsi"] for summary in summaries],
+            trend=[summary["trend"] for summary in summaries],
+            price_change=[summary["price_change_30d"] for summary in summaries],
+            volatility=[summary["volatility"] for summary in summaries]
+        )
+        analyses = {
+            summary["ticker"]: self._build_market_insights(summary, llm_insights[summary["ticker"]], recommendation)
+            for summary, recommendation in zip(summaries, recommendations)
+        }
         
         # Portfolio-level recommendations
         buy_count = sum(1 for a in analyses.values() if a.get('recommendation') == 'BUY')
@@ -398,6 +790,63 @@ Format your response as a structured analysis with clear recommendations."""
             "analysis_date": datetime.now().isoformat()
         }
     
+    def _indicator_frame(self, data: Union[List[Dict], pd.DataFrame]) -> pd.DataFrame:
+        """Build a ticker's DataFrame and calculate its technical indicators."""
+        # Work on a copy so the caller's frame is left untouched
+        df = data.copy() if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        df['timestamp'] = _utc_timestamps(df['timestamp'])
+        return self.calculate_technical_indicators(df)
+    
+    def _ticker_summary(self, ticker: str, data: Union[List[Dict], pd.DataFrame]) -> Dict[str, Any]:
+        """Calculate a ticker's indicators over its full history and summarize them."""
+        return self._summarize_indicators(ticker, self._indicator_frame(data))
+    
+    def _streaming_summary(self, ticker: str, data: Union[List[Dict], pd.DataFrame]) -> Dict[str, Any]:
+        """
+        Summarize a ticker from its streaming indicator state.
+        
+        The first call for a ticker runs the bulk calculation and seeds the state;
+        later calls only feed the bars newer than the last one already applied.
+        """
+        state = self._streaming.get(ticker)
+        if state is None:
+            df = self._indicator_frame(data)
+            state = StreamingIndicators.from_history(df['close'].to_numpy(dtype=np.float64),
+                                                     df['volume'].to_numpy(dtype=np.float64))
+            state.last_timestamp = df['timestamp'].iloc[-1]
+            self._streaming[ticker] = state
+        else:
+            df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+            df = df.assign(timestamp=_utc_timestamps(df['timestamp']))
+            new_bars = df[df['timestamp'] > state.last_timestamp].sort_values('timestamp')
+            if not new_bars.empty:
+                closes = pd.to_numeric(new_bars['close'], errors='coerce').tolist()
+                volumes = pd.to_numeric(new_bars['volume'], errors='coerce').tolist()
+                for close, volume in zip(closes, volumes):
+                    state.update(close, volume)
+                state.last_timestamp = new_bars['timestamp'].iloc[-1]
+        
+        snapshot = state.snapshot()
+        return self._summarize_latest(ticker, snapshot['latest'], snapshot['reference_close'])
+    
+    async def _get_portfolio_llm_insights(self, summaries: List[Dict[str, Any]],
+                                          batch_size: int) -> Dict[str, str]:
+        """Get LLM insights for every ticker, batching several tickers per prompt."""
+        if batch_size <= 1 or len(summaries) <= 1:
+            responses = await self._get_llm_analyses_async([summary["prompt"] for summary in summaries])
+            return {summary["ticker"]: response for summary, response in zip(summaries, responses)}
+        
+        batches = [summaries[i:i + batch_size] for i in range(0, len(summaries), batch_size)]
+        responses = await self._get_llm_analyses_async(
+            [self._create_batched_analysis_prompt(batch) for batch in batches],
+            json_mode=True,
+            max_tokens=max(1000, 300 * batch_size)
+        )
+        insights = {}
+        for batch, response in zip(batches, responses):
+            insights.update(self._parse_batched_analysis(response, [summary["ticker"] for summary in batch]))
+        return insights
+    
     def _get_portfolio_recommendation(self, analyses: Dict[str, Dict]) -> Dict[str, Any]:
         """Get portfolio-level recommendation."""
         avg_confidence = np.mean([a.get('confidence', 0.5) for a in analyses.values()])
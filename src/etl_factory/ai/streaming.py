@@ -0,0 +1,239 @@
+"""
+Stateful technical indicators that advance in O(1) per new bar.
+
+``StreamingIndicators`` carries the running state behind every indicator that
+``MarketTrendAnalyzer.calculate_technical_indicators`` produces, so intraday polls
+only pay for the bars that arrived since the last run instead of the full history.
+"""
+import math
+from collections import deque
+from typing import Any, Dict
+
+import numpy as np
+
+from etl_factory.ai import indicators_nb
+
+# Longest lookback any indicator needs (sma_50); seeding replays this many bars
+_HISTORY = 50
+
+
+class _RollingWindow:
+    """
+    Fixed-size window with a NaN-aware running sum and Welford variance.
+
+    Values are added and removed in the same order and with the same updates as
+    ``indicators_nb.sma`` and ``indicators_nb.rolling_std``, so long polling sessions
+    don't drift away from the bulk results the way a running sum of squares does.
+    """
+
+    __slots__ = ("values", "total", "count", "w_mean", "m2")
+
+    def __init__(self, size: int):
+        self.values = deque(maxlen=size)
+        self.total = 0.0
+        self.count = 0
+        self.w_mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, value: float):
+        old = self.values[0] if len(self.values) == self.values.maxlen else math.nan
+        self.values.append(value)
+        if value == value:
+            self.total += value
+            self.count += 1
+            delta = value - self.w_mean
+            self.w_mean += delta / self.count
+            self.m2 += delta * (value - self.w_mean)
+        if old == old:
+            self.total -= old
+            self.count -= 1
+            if self.count > 0:
+                delta = old - self.w_mean
+                self.w_mean -= delta / self.count
+                self.m2 -= delta * (old - self.w_mean)
+            else:
+                self.w_mean = self.m2 = 0.0
+        if self.count == 0:
+            self.total = 0.0
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count else math.nan
+
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1)."""
+        if self.count < 2:
+            return math.nan
+        var = self.m2 / (self.count - 1)
+        return math.sqrt(var) if var > 0.0 else 0.0
+
+
+class _EMAState:
+    """``ewm(span, adjust=False)`` state: the running average and its decayed weight."""
+
+    __slots__ = ("alpha", "weighted", "old_wt")
+
+    def __init__(self, span: int, weighted: float = math.nan, old_wt: float = 1.0):
+        self.alpha = 2.0 / (span + 1.0)
+        self.weighted = weighted
+        self.old_wt = old_wt
+
+    @classmethod
+    def from_series(cls, span: int, inputs: np.ndarray, outputs: np.ndarray) -> "_EMAState":
+        """Resume from the last value of a bulk EMA, decaying for trailing NaN inputs."""
+        state = cls(span, float(outputs[-1]))
+        valid = np.flatnonzero(inputs == inputs)
+        if valid.size:
+            state.old_wt = (1.0 - state.alpha) ** (len(inputs) - 1 - valid[-1])
+        return state
+
+    def update(self, value: float) -> float:
+        if self.weighted == self.weighted:
+            self.old_wt *= 1.0 - self.alpha
+            if value == value:
+                if self.weighted != value:
+                    self.weighted = ((self.old_wt * self.weighted + self.alpha * value)
+                                     / (self.old_wt + self.alpha))
+                self.old_wt = 1.0
+        elif value == value:
+            self.weighted = value
+        return self.weighted
+
+
+def _ratio(numerator: float, denominator: float) -> float:
+    """Division with NumPy semantics (x/0 -> +/-inf, 0/0 -> nan)."""
+    if denominator != 0.0:
+        return numerator / denominator
+    if numerator != numerator or numerator == 0.0:
+        return math.nan
+    return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+
+
+class StreamingIndicators:
+    """
+    Incrementally updated indicators for a single ticker.
+
+    Produces the same values as the bulk kernels in ``indicators_nb``: SMA 20/50,
+    EMA 12/26 with MACD(9), RSI(14), Bollinger Bands, volume SMA/ratio, price
+    change and 20-bar volatility.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.last_timestamp = None  # timestamp of the last bar applied, tracked by the caller
+        self.prev_close = math.nan
+        self.ema12 = _EMAState(12)
+        self.ema26 = _EMAState(26)
+        self.macd_sig = _EMAState(9)
+        self.closes = _RollingWindow(_HISTORY)  # also the sma_50 window
+        self.sma_20 = _RollingWindow(20)
+        self.volumes = _RollingWindow(20)
+        self.price_changes = _RollingWindow(20)
+        self.rsi_gain = _RollingWindow(14)
+        self.rsi_loss = _RollingWindow(14)
+        self.latest: Dict[str, Any] = {}
+
+    @classmethod
+    def from_history(cls, close: np.ndarray, volume: np.ndarray) -> "StreamingIndicators":
+        """
+        Seed the state from a full history using the bulk kernels.
+
+        The EMA states resume from the last kernel outputs; the windowed indicators
+        replay only the trailing bars they can still see.
+
+        Args:
+            close: float64 close prices in timestamp order
+            volume: float64 volumes in timestamp order
+
+        Returns:
+            StreamingIndicators positioned after the last bar
+        """
+        state = cls()
+        if len(close) == 0:
+            return state
+        ema_12, ema_26, macd, signal, _ = indicators_nb.macd(close, 12, 26, 9)
+
+        start = max(0, len(close) - _HISTORY)
+        if start:
+            state.prev_close = float(close[start - 1])
+        state.rows = start
+        for c, v in zip(close[start:].tolist(), volume[start:].tolist()):
+            state._advance_windows(c, v)
+
+        state.ema12 = _EMAState.from_series(12, close, ema_12)
+        state.ema26 = _EMAState.from_series(26, close, ema_26)
+        state.macd_sig = _EMAState.from_series(9, macd, signal)
+        state._refresh(float(close[-1]), float(volume[-1]),
+                       state.ema12.weighted, state.ema26.weighted, state.macd_sig.weighted)
+        return state
+
+    def update(self, close: float, volume: float) -> Dict[str, Any]:
+        """
+        Advance every indicator by one bar.
+
+        Args:
+            close: Close price of the new bar
+            volume: Volume of the new bar
+
+        Returns:
+            Dictionary of the indicator values at the new bar
+        """
+        close = float(close)
+        volume = float(volume)
+        self._advance_windows(close, volume)
+        ema_12 = self.ema12.update(close)
+        ema_26 = self.ema26.update(close)
+        signal = self.macd_sig.update(ema_12 - ema_26)
+        return self._refresh(close, volume, ema_12, ema_26, signal)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Last-row summary in the shape ``calculate_technical_indicators`` stores in ``df.attrs``."""
+        closes = self.closes.values
+        return {
+            'rows': self.rows,
+            'reference_close': closes[-30] if len(closes) >= 30 else closes[0],
+            'latest': {name: self.latest[name] for name in (
+                'close', 'sma_20', 'sma_50', 'macd', 'rsi', 'bb_upper', 'bb_lower', 'volatility', 'trend')}
+        }
+
+    def _advance_windows(self, close: float, volume: float):
+        """Push one bar into the ring buffers (everything except the EMA states)."""
+        delta = close - self.prev_close
+        self.rsi_gain.push(delta if delta > 0 else 0.0)
+        self.rsi_loss.push(-delta if delta < 0 else 0.0)
+        self.price_changes.push(_ratio(delta, self.prev_close))
+        self.closes.push(close)
+        self.sma_20.push(close)
+        self.volumes.push(volume)
+        self.prev_close = close
+        self.rows += 1
+
+    def _refresh(self, close: float, volume: float, ema_12: float, ema_26: float,
+                 signal: float) -> Dict[str, Any]:
+        """Recompute the latest indicator values from the current state."""
+        sma_20 = self.sma_20.mean()
+        sma_50 = self.closes.mean()
+        bb_std = self.sma_20.std()
+        volume_sma = self.volumes.mean()
+        macd = ema_12 - ema_26
+        rs = _ratio(self.rsi_gain.mean(), self.rsi_loss.mean())
+        diff = close - sma_20
+        self.latest = {
+            'close': close,
+            'sma_20': sma_20,
+            'sma_50': sma_50,
+            'ema_12': ema_12,
+            'ema_26': ema_26,
+            'macd': macd,
+            'macd_signal': signal,
+            'macd_histogram': macd - signal,
+            'rsi': 100.0 - 100.0 / (1.0 + rs),
+            'bb_middle': sma_20,
+            'bb_upper': sma_20 + bb_std * 2,
+            'bb_lower': sma_20 - bb_std * 2,
+            'volume_sma': volume_sma,
+            'volume_ratio': _ratio(volume, volume_sma),
+            'price_change': self.price_changes.values[-1],
+            'volatility': self.price_changes.std(),
+            'trend': 'bullish' if diff > 0 else 'bearish' if diff < 0 else 'neutral',
+        }
+        return self.latest
@@ -1,4 +1,5 @@
 import configparser
+import functools
 from pathlib import Path
 import json
 import os
@@ -6,32 +7,69 @@ import os
 env = os.getenv("run_env", "local")
 
 def remove_quotes(d):
-    if isinstance(d, dict):
-        return {k: remove_quotes(v) for k, v in d.items()}
-    elif isinstance(d, list):
-        return [remove_quotes(i) for i in d]
-    elif isinstance(d, str):
+    """Strip surrounding double quotes from every string in a (possibly nested) value."""
+    if isinstance(d, str):
         return d.strip('"')
-    else:
+    if not isinstance(d, (dict, list)):
         return d
+    # Walk nested containers with an explicit stack instead of recursing
+    root = {} if isinstance(d, dict) else []
+    stack = [(d, root)]
+    while stack:
+        source, target = stack.pop()
+        items = source.items() if isinstance(source, dict) else enumerate(source)
+        for k, v in items:
+            if isinstance(v, str):
+                v = v.strip('"')
+            elif isinstance(v, (dict, list)):
+                child = {} if isinstance(v, dict) else []
+                stack.append((v, child))
+                v = child
+            if isinstance(target, dict):
+                target[k] = v
+            else:
+                target.append(v)
+    return root
+
+@functools.lru_cache(maxsize=None)
+def _load(file_path):
+    """Parse an INI file once; later loaders for the same path share the parser."""
+    parser = configparser.ConfigParser(interpolation=None)
+    parser.read(file_path)
+    return parser
+
+
 class EnvConfigLoader:
     def __init__(self, config_dir=None):
 
         config_dir = Path(__file__).parent
         self.file_path = Path(config_dir) / f"{env}.ini"
-        self.config = configparser.ConfigParser(interpolation=None)
         print (self.file_path)
         print(config_dir)
-        self.config.read(self.file_path)
+        self.config = _load(self.file_path)
+        # Plain-dict snapshot of every section (with DEFAULT values merged in, as
+        # configparser would resolve them), so lookups skip configparser's machinery
+        defaults = dict(self.config.defaults())
+        self._values = {section: {**defaults, **dict(self.config.items(section))}
+                        for section in self.config.sections()}
 
     def get_value(self, section, key, fallback=None):
-        try:
-            return self.config.get(section, key, fallback=fallback)
-        except configparser.NoSectionError:
+        values = self._values.get(section)
+        if values is None:
             # If section doesn't exist and fallback is provided, return fallback
             # Otherwise, raise the error
             if fallback is not None:
                 return fallback
-            raise
+            raise configparser.NoSectionError(section)
+        return values.get(self.config.optionxform(key), fallback)
+
+    def get_section(self, section):
+        """Return a copy of a section's key/value pairs (empty if the section is missing)."""
+        return dict(self._values.get(section, {}))
+
+@functools.lru_cache(maxsize=1)
+def get_config_loader():
+    """Return the process-wide EnvConfigLoader, reading the INI file only once."""
+    return EnvConfigLoader()
 
-config = EnvConfigLoader()
\ No newline at end of file
+config = get_config_loader()
\ No newline at end of file
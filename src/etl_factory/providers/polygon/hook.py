@@ -1,8 +1,27 @@
 from polygon import RESTClient
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from urllib3.exceptions import MaxRetryError
+import functools
 import os
+import time
 from etl_factory.utils.base import BaseHook
 
+# Timespans whose bars never straddle a day boundary, so date windows split cleanly
+PARALLEL_TIMESPANS = {"second", "minute", "hour", "day"}
+
+# The RESTClient only retries 429s for well under a second; Polygon's limits are per
+# minute, so rate-limited fetches are retried again after 2, 4, 8, 16 and 32 seconds
+RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF = 2.0
+
+
+def _is_rate_limited(exc: MaxRetryError) -> bool:
+    """Tell whether urllib3 gave up because of repeated 429 responses."""
+    return "429" in str(exc.reason)
+
+
 class PolygonHook(BaseHook):
     """
     Hook for interacting with Polygon API.
@@ -34,9 +53,13 @@ class PolygonHook(BaseHook):
         self.conn = self.get_connection()
 
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def read_file(key=None, file_path=None):
         """
-        Read the content of a file. 
+        Read the content of a file, stripped of surrounding whitespace.
+
+        Results are cached per argument, so every hook built from the same key file
+        reads it from disk once.
 
         Args:
             key (str): Key to be read.
@@ -49,8 +72,7 @@ class PolygonHook(BaseHook):
         if key is not None:
             return key
         if file_path is not None:
-            with open(file_path, 'r') as file:
-                return file.read()
+            return Path(file_path).read_text().strip()
         return None
 
     def get_connection(self):
@@ -60,7 +82,71 @@ class PolygonHook(BaseHook):
         return conn
 
     def get_aggregates(self, ticker, multiplier=1, timespan="minute",from_="2025-08-05", to=datetime.now().strftime("%Y-%m-%d"), limit=50000):
-        return [a for a in self.conn.list_aggs(ticker=ticker, multiplier=multiplier,timespan=timespan, from_=from_, to=to,limit=limit)]
+        return self._fetch_aggregates(self.conn, ticker, multiplier, timespan, from_, to, limit)
+
+    @staticmethod
+    def _fetch_aggregates(conn, ticker, multiplier, timespan, from_, to, limit):
+        """
+        Drain list_aggs for one range, backing off exponentially while rate limited.
+
+        A rate-limited range is fetched again from its start, since list_aggs cannot
+        resume a partly read pagination.
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            try:
+                return [a for a in conn.list_aggs(ticker=ticker, multiplier=multiplier, timespan=timespan,
+                                                  from_=from_, to=to, limit=limit)]
+            except MaxRetryError as exc:
+                if attempt == RATE_LIMIT_RETRIES or not _is_rate_limited(exc):
+                    raise
+                time.sleep(RATE_LIMIT_BACKOFF * 2 ** attempt)
+
+    def get_aggregates_parallel(self, ticker, multiplier=1, timespan="minute", from_="2025-08-05", to=None, limit=50000, chunks=8):
+        """
+        Fetch aggregates by splitting the date range into windows requested concurrently.
+
+        Each window is paginated sequentially by list_aggs, but the windows overlap in
+        time, so wall time is roughly that of the largest window. Every worker uses its
+        own RESTClient, since one client pools a single connection per host. Windows
+        that stay rate limited (429) are retried with exponential backoff.
+
+        Only single-unit bars (``multiplier == 1``) of at most a day are split, so no
+        bar can straddle a window boundary; other requests, and ranges not given as
+        YYYY-MM-DD dates (e.g. millisecond timestamps), are fetched in one call.
+
+        Args:
+            ticker (str): Ticker symbol.
+            multiplier (int): Size of the timespan multiplier.
+            timespan (str): Size of the time window.
+            from_ (str): Start date (YYYY-MM-DD).
+            to (str): End date (YYYY-MM-DD), defaults to today.
+            limit (int): Page size passed to list_aggs.
+            chunks (int): Maximum number of date windows fetched in parallel.
+
+        Returns:
+            list: Aggregates for the whole range, in chronological order.
+        """
+        to = to or datetime.now().strftime("%Y-%m-%d")
+        if chunks <= 1 or multiplier != 1 or timespan not in PARALLEL_TIMESPANS:
+            return self.get_aggregates(ticker, multiplier=multiplier, timespan=timespan, from_=from_, to=to, limit=limit)
+        try:
+            start, end = date.fromisoformat(from_), date.fromisoformat(to)
+        except (TypeError, ValueError):
+            return self.get_aggregates(ticker, multiplier=multiplier, timespan=timespan, from_=from_, to=to, limit=limit)
+        days = (end - start).days + 1
+        chunks = max(1, min(chunks, days))
+        if chunks == 1:
+            return self.get_aggregates(ticker, multiplier=multiplier, timespan=timespan, from_=from_, to=to, limit=limit)
+
+        bounds = [start + timedelta(days=days * i // chunks) for i in range(chunks + 1)]
+        windows = [(bounds[i].isoformat(), (bounds[i + 1] - timedelta(days=1)).isoformat()) for i in range(chunks)]
+        with ThreadPoolExecutor(max_workers=chunks) as executor:
+            parts = executor.map(
+                lambda window: self._fetch_aggregates(self.get_connection(), ticker, multiplier, timespan,
+                                                      window[0], window[1], limit),
+                windows
+            )
+            return [agg for part in parts for agg in part]
 
     def get_last_trade(self, ticker):
         trade = self.conn.get_last_trade(ticker=ticker)
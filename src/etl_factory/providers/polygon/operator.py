@@ -1,9 +1,21 @@
-from typing import List, Dict, Optional
+import functools
+from typing import List, Dict, Optional, Union
 from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
 from etl_factory.utils.base import BaseOperator
 from etl_factory.providers.polygon.hook import PolygonHook
 
 
+_AGGREGATE_FIELDS = ("open", "high", "low", "close", "volume", "vwap", "transactions")
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_polygon_hook() -> PolygonHook:
+    """Return a process-wide PolygonHook so operators share one RESTClient connection pool."""
+    return PolygonHook()
+
+
 class PolygonOperator(BaseOperator):
     """
     Operator for downloading stock data from Polygon API.
@@ -13,7 +25,8 @@ class PolygonOperator(BaseOperator):
     def __init__(self, ticker: str, operation: str = "aggregates", 
                  multiplier: int = 1, timespan: str = "day",
                  from_date: Optional[str] = None, to_date: Optional[str] = None,
-                 limit: int = 5000, **kwargs):
+                 limit: int = 5000, hook: Optional[PolygonHook] = None,
+                 as_frame: bool = False, chunks: int = 1, **kwargs):
         """
         Initialize the PolygonOperator with stock data parameters.
         
@@ -25,6 +38,9 @@ class PolygonOperator(BaseOperator):
             from_date: Start date (YYYY-MM-DD format, defaults to 30 days ago)
             to_date: End date (YYYY-MM-DD format, defaults to today)
             limit: Maximum number of results to return
+            hook: PolygonHook to use (defaults to a hook shared by all operators)
+            as_frame: Return aggregates as a column-built DataFrame instead of a list of dictionaries
+            chunks: Number of date windows to fetch aggregates for in parallel (1 = sequential)
             **kwargs: Additional keyword arguments passed to BaseOperator
         """
         super().__init__(config_section="POLYGON", **kwargs)
@@ -35,28 +51,35 @@ class PolygonOperator(BaseOperator):
         self.from_date = from_date or (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
         self.to_date = to_date or datetime.now().strftime("%Y-%m-%d")
         self.limit = limit
-        self.hook = PolygonHook()
+        self.hook = hook or _shared_polygon_hook()
+        self.as_frame = as_frame
+        self.chunks = chunks
 
-    def execute(self) -> List[Dict]:
+    def execute(self) -> Union[List[Dict], pd.DataFrame]:
         """
         Execute the stock data extraction operation.
         
         Returns:
-            List of dictionaries containing stock data
+            List of dictionaries containing stock data, or a DataFrame for
+            aggregates when ``as_frame`` is set
             
         Raises:
             ValueError: If operation is not supported or required parameters are missing
         """
         if self.operation == "aggregates":
-            aggregates = self.hook.get_aggregates(
+            aggregates = self.hook.get_aggregates_parallel(
                 ticker=self.ticker,
                 multiplier=self.multiplier,
                 timespan=self.timespan,
                 from_=self.from_date,
                 to=self.to_date,
-                limit=self.limit
+                limit=self.limit,
+                chunks=self.chunks
             )
-            # Convert to list of dictionaries
+            if self.as_frame:
+                return self._aggregates_frame(aggregates)
+            # Convert to list of dictionaries; all rows of one fetch share the extraction time
+            extracted_at = datetime.now().isoformat()
             data = []
             for agg in aggregates:
                 data.append({
@@ -69,7 +92,7 @@ class PolygonOperator(BaseOperator):
                     "volume": agg.volume if hasattr(agg, 'volume') else None,
                     "vwap": agg.vwap if hasattr(agg, 'vwap') else None,
                     "transactions": agg.transactions if hasattr(agg, 'transactions') else None,
-                    "extracted_at": datetime.now().isoformat()
+                    "extracted_at": extracted_at
                 })
             return data
             
@@ -97,3 +120,25 @@ class PolygonOperator(BaseOperator):
             
         else:
             raise ValueError(f"Unsupported operation: {self.operation}. Supported operations: aggregates, last_trade, last_quote")
+
+    def _aggregates_frame(self, aggregates: List) -> pd.DataFrame:
+        """
+        Build a DataFrame from aggregate bars column by column.
+
+        Values are written into preallocated typed arrays in a single pass, so no
+        per-bar dictionaries or ISO strings are created. Timestamps are UTC.
+        """
+        n = len(aggregates)
+        timestamps = np.empty(n, dtype=np.int64)
+        values = np.empty((len(_AGGREGATE_FIELDS), n), dtype=np.float64)
+        for i, agg in enumerate(aggregates):
+            timestamps[i] = agg.timestamp
+            # None fields become NaN
+            values[:, i] = [getattr(agg, field, None) for field in _AGGREGATE_FIELDS]
+
+        return pd.DataFrame({
+            "ticker": self.ticker,
+            "timestamp": pd.to_datetime(timestamps, unit="ms", utc=True),
+            **dict(zip(_AGGREGATE_FIELDS, values)),
+            "extracted_at": datetime.now().isoformat()
+        })
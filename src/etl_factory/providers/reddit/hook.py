@@ -1,7 +1,177 @@
+import asyncio
+import functools
+import threading
 import praw
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Optional
+from itertools import islice, zip_longest
+from typing import Dict, Iterator, List, Mapping, Optional, Union
 from etl_factory.utils.base import BaseHook
+from etl_factory.utils.common.common import ttl_cached
+
+try:
+    import asyncpraw
+except ImportError:
+    asyncpraw = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Largest comment tree Reddit returns in a single request
+_MAX_COMMENT_LIMIT = 2048
+
+# Worker threads per hook; each keeps one PRAW connection for the hook's lifetime
+_MAX_WORKERS = 8
+
+# Process-wide cap on in-flight threaded requests. This bounds concurrency only; each
+# PRAW connection paces itself against Reddit's rate-limit headers.
+_REQUEST_SLOTS = threading.Semaphore(4)
+
+
+@functools.lru_cache(maxsize=128)
+def _keyword_matcher(keywords: tuple):
+    """
+    Return a predicate telling whether lowercased text contains any of ``keywords``.
+    
+    With pyahocorasick installed, all keywords are matched in a single pass over the
+    text by one automaton, built once per keyword tuple. An empty keyword is
+    contained in every text, so it makes the predicate match everything.
+    """
+    lowered = tuple(keyword.lower() for keyword in keywords)
+    if "" in lowered:
+        return lambda text: True
+    if ahocorasick is None:
+        return lambda text: any(keyword in text for keyword in lowered)
+    automaton = ahocorasick.Automaton()
+    for index, keyword in enumerate(lowered):
+        automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+
+def _per_term_limit(limit: int, terms: List[str]) -> int:
+    """Split a total result ``limit`` evenly across the search terms, rounding up."""
+    return -(-limit // max(1, len(terms)))
+
+
+def _merge_results(results: List[List[tuple]], limit: int) -> Iterator:
+    """
+    Interleave per-term ``(id, row)`` results round-robin, skipping duplicates.
+    
+    Taking one row from each term in turn keeps every keyword represented when
+    the total is capped at ``limit``.
+    """
+    seen = set()
+    for batch in zip_longest(*results):
+        for item in batch:
+            if item is None or item[0] in seen:
+                continue
+            seen.add(item[0])
+            yield item[1]
+            if len(seen) >= limit:
+                return
+
+
+def _iter_comments(forest):
+    """
+    Walk a comment forest breadth-first, in the same order as ``CommentForest.list()``.
+    
+    Comments are yielded as they are reached, so callers that stop early never
+    build the full flattened list.
+    """
+    queue = deque(forest)
+    while queue:
+        comment = queue.popleft()
+        yield comment
+        queue.extend(getattr(comment, "replies", ()))
+
+
+# Fields of a submission result row, shared by the dict rows and SubmissionRow
+_SUBMISSION_FIELDS = ("id", "title", "author", "created_utc", "score", "upvote_ratio",
+                      "num_comments", "url", "selftext", "subreddit", "permalink", "is_self",
+                      "over_18", "keywords", "extracted_at")
+
+
+def _submission_row(submission, keywords: List[str], extracted_at: str) -> Dict:
+    """Build the result row for a submission (PRAW or Async PRAW), keyed by ``_SUBMISSION_FIELDS``."""
+    author = submission.author
+    return {
+        "id": submission.id,
+        "title": submission.title,
+        "author": str(author) if author else "[deleted]",
+        "created_utc": datetime.fromtimestamp(submission.created_utc).isoformat(),
+        "score": submission.score,
+        "upvote_ratio": submission.upvote_ratio,
+        "num_comments": submission.num_comments,
+        "url": submission.url,
+        "selftext": submission.selftext,
+        "subreddit": str(submission.subreddit),
+        "permalink": f"https://reddit.com{submission.permalink}",
+        "is_self": submission.is_self,
+        "over_18": submission.over_18,
+        "keywords": keywords,
+        "extracted_at": extracted_at
+    }
+
+
+@dataclass
+class SubmissionRow:
+    """
+    Compact submission record with the same fields as the ``search_submissions`` dict rows.
+    
+    Instances have ``__slots__`` instead of a per-row ``__dict__``, which keeps large
+    result sets several times smaller than the equivalent dicts.
+    """
+    __slots__ = _SUBMISSION_FIELDS
+
+    id: str
+    title: str
+    author: str
+    created_utc: str
+    score: int
+    upvote_ratio: float
+    num_comments: int
+    url: str
+    selftext: str
+    subreddit: str
+    permalink: str
+    is_self: bool
+    over_18: bool
+    keywords: List[str]
+    extracted_at: str
+
+    @classmethod
+    def from_submission(cls, submission, keywords: List[str], extracted_at: str) -> "SubmissionRow":
+        """
+        Build the row for a submission (PRAW or Async PRAW).
+        
+        Goes through ``_submission_row`` so both row types always carry the same
+        values; a field added to one but not the other fails here by keyword.
+        """
+        return cls(**_submission_row(submission, keywords, extracted_at))
+
+    def to_dict(self) -> Dict:
+        """Return the row as a dict keyed by field name, in field order."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _comment_row(comment, submission, extracted_at: str) -> Dict:
+    """Build the result row for a comment of ``submission``."""
+    author = comment.author
+    return {
+        "id": comment.id,
+        "author": str(author) if author else "[deleted]",
+        "body": comment.body,
+        "created_utc": datetime.fromtimestamp(comment.created_utc).isoformat(),
+        "score": comment.score,
+        "submission_id": submission.id,
+        "submission_title": submission.title,
+        "extracted_at": extracted_at
+    }
 
 
 class RedditHook(BaseHook):
@@ -10,21 +180,27 @@ class RedditHook(BaseHook):
     This class extends BaseHook to provide functionality for downloading Reddit data based on keywords.
     """
 
-    def __init__(self, config_section="REDDIT", **kwargs):
+    def __init__(self, config_section="REDDIT", cfg: Optional[Mapping[str, str]] = None, **kwargs):
         """
         Initialize the RedditHook with Reddit API credentials.
         
         Args:
             config_section: Configuration section name in config file
-            **kwargs: Additional keyword arguments
+            cfg: Already-loaded config section to read the credentials from instead
+            **kwargs: Additional keyword arguments (``verify_auth=True`` checks the
+                username/password login when connecting)
         """
         super().__init__(**kwargs)
+        if cfg is None:
+            section = config_section.lower()
+            cfg = {key: self.get_config(key, section=section, fallback="")
+                   for key in ("client_id", "client_secret", "user_agent", "username", "password")}
         # Get config values and treat empty strings as None/empty
-        client_id = self.get_config("client_id", section=config_section.lower(), fallback="") or None
-        client_secret = self.get_config("client_secret", section=config_section.lower(), fallback="") or None
-        user_agent = self.get_config("user_agent", section=config_section.lower(), fallback="ETL Pipeline/1.0") or "ETL Pipeline/1.0"
-        username = self.get_config("username", section=config_section.lower(), fallback="") or None
-        password = self.get_config("password", section=config_section.lower(), fallback="") or None
+        client_id = cfg.get("client_id") or None
+        client_secret = cfg.get("client_secret") or None
+        user_agent = cfg.get("user_agent") or "ETL Pipeline/1.0"
+        username = cfg.get("username") or None
+        password = cfg.get("password") or None
         
         self.client_id = client_id
         self.client_secret = client_secret
@@ -32,14 +208,31 @@ class RedditHook(BaseHook):
         self.username = username
         self.password = password
         self.reddit = self.get_connection()
+        # PRAW instances are not thread-safe; worker threads get their own (see _thread_reddit)
+        self._local = threading.local()
+        self._local.reddit = self.reddit
+        self._executor = None
 
-    def get_connection(self):
+    @classmethod
+    def from_config(cls, cfg: Mapping[str, str], **kwargs) -> "RedditHook":
         """
-        Create and return a Reddit API connection.
+        Create a hook from an already-loaded config section.
         
+        Args:
+            cfg: Mapping with client_id, client_secret, user_agent, username and password
+            **kwargs: Additional keyword arguments
+            
         Returns:
-            praw.Reddit: Reddit API client instance
+            RedditHook instance
         """
+        return cls(cfg=cfg, **kwargs)
+
+    def _cache_identity(self):
+        """Credentials that scope this hook's API cache entries."""
+        return (self.client_id, self.username)
+
+    def _connection_params(self) -> Dict:
+        """Build the keyword arguments shared by the PRAW and Async PRAW clients."""
         if not self.client_id or not self.client_secret:
             raise ConnectionError("Reddit client_id and client_secret are required!")
         
@@ -54,11 +247,20 @@ class RedditHook(BaseHook):
         if self.username and self.password:
             connection_params["username"] = self.username
             connection_params["password"] = self.password
+        return connection_params
+
+    def get_connection(self):
+        """
+        Create and return a Reddit API connection.
         
-        reddit = praw.Reddit(**connection_params)
+        Returns:
+            praw.Reddit: Reddit API client instance
+        """
+        reddit = praw.Reddit(**self._connection_params())
         
-        # Verify connection if authenticated
-        if self.username and self.password:
+        # Verifying costs a request on every construction; PRAW raises on first use
+        # anyway, so only do it when asked with RedditHook(verify_auth=True)
+        if self.username and self.password and getattr(self, "verify_auth", False):
             try:
                 reddit.user.me()
             except Exception:
@@ -67,102 +269,189 @@ class RedditHook(BaseHook):
         
         return reddit
 
-    def search_submissions(self, keywords: List[str], subreddit: Optional[str] = None, 
-                          limit: int = 100, sort: str = "relevance") -> List[Dict]:
+    def _thread_reddit(self):
         """
-        Search for Reddit submissions based on keywords.
+        Return the ``praw.Reddit`` instance for the calling thread.
+        
+        PRAW's rate limiter and auth state are not safe to share across threads, so
+        the thread that created the hook uses ``self.reddit`` and every other thread
+        lazily builds its own connection. The hook's worker threads live as long as
+        the hook, so their connections (and OAuth tokens) are built once each.
+        """
+        reddit = getattr(self._local, "reddit", None)
+        if reddit is None:
+            reddit = self._local.reddit = self.get_connection()
+        return reddit
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the hook's long-lived worker pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS,
+                                                thread_name_prefix="reddit-hook")
+        return self._executor
+
+    def close(self):
+        """Shut down the hook's worker threads, if any were started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def iter_submissions(self, keywords: List[str], subreddit: Optional[str] = None,
+                         limit: int = 100, sort: str = "relevance",
+                         query: Optional[str] = None,
+                         as_rows: bool = False) -> Iterator[Union[Dict, SubmissionRow]]:
+        """
+        Search for Reddit submissions based on keywords, yielding rows as they are merged.
+        
+        Each keyword is searched separately for its share of ``limit`` and the
+        requests run concurrently on the hook's worker pool, each thread with its
+        own PRAW connection. Results are interleaved round-robin across keywords;
+        submissions matched by several keywords are yielded once, up to ``limit`` in total.
         
         Args:
             keywords: List of keywords to search for
             subreddit: Optional subreddit to search in (None = all of Reddit)
             limit: Maximum number of results to return
             sort: Sort method ("relevance", "hot", "top", "new", "comments")
+            query: Prebuilt search query; when given, one search is run for it
+                instead of one per keyword
+            as_rows: Yield ``SubmissionRow`` objects instead of dictionaries
             
-        Returns:
-            List of dictionaries containing submission data
+        Yields:
+            Dictionaries (or ``SubmissionRow`` objects) containing submission data
         """
-        query = " OR ".join(keywords)
-        results = []
+        extracted_at = datetime.now().isoformat()
+        terms = [query] if query is not None else keywords
+        per_term = _per_term_limit(limit, terms)
+        build_row = SubmissionRow.from_submission if as_rows else _submission_row
+        
+        def search_one(term: str) -> List[tuple]:
+            subreddit_obj = self._thread_reddit().subreddit(subreddit or "all")
+            with _REQUEST_SLOTS:
+                return [
+                    (submission.id, build_row(submission, keywords, extracted_at))
+                    for submission in subreddit_obj.search(term, limit=per_term, sort=sort)
+                ]
         
         try:
-            if subreddit:
-                subreddit_obj = self.reddit.subreddit(subreddit)
-                submissions = subreddit_obj.search(query, limit=limit, sort=sort)
-            else:
-                submissions = self.reddit.subreddit("all").search(query, limit=limit, sort=sort)
-            
-            for submission in submissions:
-                result = {
-                    "id": submission.id,
-                    "title": submission.title,
-                    "author": str(submission.author) if submission.author else "[deleted]",
-                    "created_utc": datetime.fromtimestamp(submission.created_utc).isoformat(),
-                    "score": submission.score,
-                    "upvote_ratio": submission.upvote_ratio,
-                    "num_comments": submission.num_comments,
-                    "url": submission.url,
-                    "selftext": submission.selftext,
-                    "subreddit": str(submission.subreddit),
-                    "permalink": f"https://reddit.com{submission.permalink}",
-                    "is_self": submission.is_self,
-                    "over_18": submission.over_18,
-                    "keywords": keywords,
-                    "extracted_at": datetime.now().isoformat()
-                }
-                results.append(result)
+            results = list(self._get_executor().map(search_one, terms))
+            yield from _merge_results(results, limit)
         except Exception as e:
             raise Exception(f"Error searching Reddit submissions: {str(e)}")
+
+    @ttl_cached()
+    def search_submissions(self, keywords: List[str], subreddit: Optional[str] = None, 
+                          limit: int = 100, sort: str = "relevance", query: Optional[str] = None,
+                          as_rows: bool = False) -> List[Union[Dict, SubmissionRow]]:
+        """
+        Search for Reddit submissions based on keywords.
         
-        return results
+        See ``iter_submissions`` for the arguments; this collects its rows into a list.
+        
+        Returns:
+            List of dictionaries (or ``SubmissionRow`` objects with ``as_rows=True``)
+            containing submission data
+        """
+        return list(self.iter_submissions(keywords, subreddit, limit, sort, query, as_rows))
 
-    def get_hot_posts(self, subreddit: str, limit: int = 100, keywords: Optional[List[str]] = None) -> List[Dict]:
+    @ttl_cached()
+    def search_submission_columns(self, keywords: List[str], subreddit: Optional[str] = None,
+                                  limit: int = 100, sort: str = "relevance",
+                                  query: Optional[str] = None) -> Dict[str, List]:
         """
-        Get hot posts from a subreddit, optionally filtered by keywords.
+        Search for Reddit submissions, returning the results column-wise.
+        
+        Same rows as ``search_submissions``, laid out as one list per field so bulk
+        loaders can consume them directly (e.g. ``pyarrow.Table.from_pydict``).
+        
+        Returns:
+            Dictionary mapping each submission field to its list of values
+        """
+        columns = {name: [] for name in SubmissionRow.__slots__}
+        appends = [(name, columns[name].append) for name in SubmissionRow.__slots__]
+        for row in self.iter_submissions(keywords, subreddit, limit, sort, query, as_rows=True):
+            for name, append in appends:
+                append(getattr(row, name))
+        return columns
+
+    def iter_hot_posts(self, subreddit: str, limit: int = 100,
+                       keywords: Optional[List[str]] = None) -> Iterator[Dict]:
+        """
+        Get hot posts from a subreddit, optionally filtered by keywords, yielding rows as they arrive.
         
         Args:
             subreddit: Name of the subreddit
             limit: Maximum number of posts to return
             keywords: Optional list of keywords to filter posts by
             
-        Returns:
-            List of dictionaries containing post data
+        Yields:
+            Dictionaries containing post data
         """
-        results = []
+        matches = _keyword_matcher(tuple(keywords)) if keywords else None
+        extracted_at = datetime.now().isoformat()
         
         try:
-            subreddit_obj = self.reddit.subreddit(subreddit)
+            subreddit_obj = self._thread_reddit().subreddit(subreddit)
             posts = subreddit_obj.hot(limit=limit)
             
             for post in posts:
                 # Filter by keywords if provided
-                if keywords:
-                    text_content = f"{post.title} {post.selftext}".lower()
-                    if not any(keyword.lower() in text_content for keyword in keywords):
-                        continue
+                if matches and not matches(f"{post.title} {post.selftext}".lower()):
+                    continue
                 
-                result = {
-                    "id": post.id,
-                    "title": post.title,
-                    "author": str(post.author) if post.author else "[deleted]",
-                    "created_utc": datetime.fromtimestamp(post.created_utc).isoformat(),
-                    "score": post.score,
-                    "upvote_ratio": post.upvote_ratio,
-                    "num_comments": post.num_comments,
-                    "url": post.url,
-                    "selftext": post.selftext,
-                    "subreddit": str(post.subreddit),
-                    "permalink": f"https://reddit.com{post.permalink}",
-                    "is_self": post.is_self,
-                    "over_18": post.over_18,
-                    "keywords": keywords or [],
-                    "extracted_at": datetime.now().isoformat()
-                }
-                results.append(result)
+                yield _submission_row(post, keywords or [], extracted_at)
         except Exception as e:
             raise Exception(f"Error getting hot posts from r/{subreddit}: {str(e)}")
+
+    @ttl_cached()
+    def get_hot_posts(self, subreddit: str, limit: int = 100, keywords: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Get hot posts from a subreddit, optionally filtered by keywords.
         
-        return results
+        Args:
+            subreddit: Name of the subreddit
+            limit: Maximum number of posts to return
+            keywords: Optional list of keywords to filter posts by
+            
+        Returns:
+            List of dictionaries containing post data
+        """
+        return list(self.iter_hot_posts(subreddit, limit, keywords))
+
+    def iter_comments(self, submission_id: str, limit: int = 100) -> Iterator[Dict]:
+        """
+        Get comments from a Reddit submission, yielding rows as they are walked.
+        
+        Args:
+            submission_id: ID of the Reddit submission
+            limit: Maximum number of comments to return
+            
+        Yields:
+            Dictionaries containing comment data
+        """
+        extracted_at = datetime.now().isoformat()
+        
+        try:
+            submission = self._thread_reddit().submission(id=submission_id)
+            # Only ask for as many comments as will be returned (must be set before the fetch)
+            submission.comment_limit = min(max(limit, 1), _MAX_COMMENT_LIMIT)
+            # limit=0 only prunes the MoreComments stubs; it never fetches them, so
+            # this costs no requests regardless of thread size
+            submission.comments.replace_more(limit=0)
+            
+            for comment in islice(_iter_comments(submission.comments), limit):
+                if hasattr(comment, "body"):
+                    yield _comment_row(comment, submission, extracted_at)
+        except Exception as e:
+            raise Exception(f"Error getting comments for submission {submission_id}: {str(e)}")
 
+    @ttl_cached()
     def get_comments(self, submission_id: str, limit: int = 100) -> List[Dict]:
         """
         Get comments from a Reddit submission.
@@ -174,30 +463,180 @@ class RedditHook(BaseHook):
         Returns:
             List of dictionaries containing comment data
         """
-        results = []
+        return list(self.iter_comments(submission_id, limit))
+
+    def get_comments_bulk(self, submission_ids: List[str], limit_per: int = 100) -> List[Dict]:
+        """
+        Get comments from many Reddit submissions.
+        
+        Every comment tree comes from its own endpoint (``reddit.info`` returns
+        submissions without comments), so the per-submission requests are run
+        concurrently on the hook's worker pool instead, each thread with its own
+        PRAW connection.
+        
+        Args:
+            submission_ids: IDs of the Reddit submissions
+            limit_per: Maximum number of comments to return per submission
+            
+        Returns:
+            List of dictionaries containing comment data, in submission order
+        """
+        if not submission_ids:
+            return []
+        
+        def fetch_one(submission_id: str) -> List[Dict]:
+            with _REQUEST_SLOTS:
+                return self.get_comments(submission_id, limit=limit_per)
+        
+        return [row for rows in self._get_executor().map(fetch_one, submission_ids) for row in rows]
+
+    def get_async_connection(self):
+        """
+        Create and return an Async PRAW connection.
+        
+        Async PRAW clients are bound to the event loop that uses them, so every
+        async method opens its own and closes it when done.
+        
+        Returns:
+            asyncpraw.Reddit: Async Reddit API client instance
+        """
+        if asyncpraw is None:
+            raise ImportError("asyncpraw package not installed. Install with: pip install asyncpraw")
+        return asyncpraw.Reddit(**self._connection_params())
+
+    async def asearch_submissions(self, keywords: List[str], subreddit: Optional[str] = None,
+                                  limit: int = 100, sort: str = "relevance", reddit=None,
+                                  query: Optional[str] = None) -> List[Dict]:
+        """
+        Async variant of ``search_submissions``.
+        
+        Like the sync path, each keyword is searched for its share of ``limit``
+        (the searches are gathered) and the results are interleaved round-robin.
+        
+        Args:
+            keywords: List of keywords to search for
+            subreddit: Optional subreddit to search in (None = all of Reddit)
+            limit: Maximum number of results to return
+            sort: Sort method ("relevance", "hot", "top", "new", "comments")
+            reddit: Open Async PRAW client to reuse (a new one is opened and closed if None)
+            query: Prebuilt search query; when given, one search is run for it
+                instead of one per keyword
+            
+        Returns:
+            List of dictionaries containing submission data
+        """
+        if reddit is None:
+            reddit = self.get_async_connection()
+            try:
+                return await self.asearch_submissions(keywords, subreddit, limit, sort,
+                                                      reddit=reddit, query=query)
+            finally:
+                await reddit.close()
+        
+        terms = [query] if query is not None else keywords
+        per_term = _per_term_limit(limit, terms)
+        extracted_at = datetime.now().isoformat()
+        
+        async def search_one(term: str) -> List[tuple]:
+            return [
+                (submission.id, _submission_row(submission, keywords, extracted_at))
+                async for submission in subreddit_obj.search(term, limit=per_term, sort=sort)
+            ]
         
         try:
-            submission = self.reddit.submission(id=submission_id)
-            submission.comments.replace_more(limit=0)
+            subreddit_obj = await reddit.subreddit(subreddit or "all")
+            results = await asyncio.gather(*(search_one(term) for term in terms))
+            return list(_merge_results(results, limit))
+        except Exception as e:
+            raise Exception(f"Error searching Reddit submissions: {str(e)}")
+
+    async def asearch_many(self, keyword_groups: List[List[str]], subreddits: Optional[List[Optional[str]]] = None,
+                           limit: int = 100, sort: str = "relevance") -> List[Dict]:
+        """
+        Run several searches concurrently over one Async PRAW client.
+        
+        Every keyword group is searched in every subreddit, and the requests are
+        gathered so their round-trips overlap instead of running back to back.
+        
+        Args:
+            keyword_groups: Keyword lists, one search per list
+            subreddits: Subreddits to search in (None = all of Reddit)
+            limit: Maximum number of results per search
+            sort: Sort method ("relevance", "hot", "top", "new", "comments")
             
-            for comment in submission.comments.list()[:limit]:
-                if hasattr(comment, "body"):
-                    result = {
-                        "id": comment.id,
-                        "author": str(comment.author) if comment.author else "[deleted]",
-                        "body": comment.body,
-                        "created_utc": datetime.fromtimestamp(comment.created_utc).isoformat(),
-                        "score": comment.score,
-                        "submission_id": submission_id,
-                        "submission_title": submission.title,
-                        "extracted_at": datetime.now().isoformat()
-                    }
-                    results.append(result)
+        Returns:
+            List of dictionaries containing submission data, in search order
+        """
+        reddit = self.get_async_connection()
+        try:
+            searches = await asyncio.gather(*(
+                self.asearch_submissions(keywords, subreddit, limit, sort, reddit=reddit)
+                for subreddit in (subreddits or [None])
+                for keywords in keyword_groups
+            ))
+        finally:
+            await reddit.close()
+        return [row for rows in searches for row in rows]
+
+    async def aget_hot_posts(self, subreddit: str, limit: int = 100,
+                             keywords: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Async variant of ``get_hot_posts``.
+        
+        Args:
+            subreddit: Name of the subreddit
+            limit: Maximum number of posts to return
+            keywords: Optional list of keywords to filter posts by
+            
+        Returns:
+            List of dictionaries containing post data
+        """
+        results = []
+        matches = _keyword_matcher(tuple(keywords)) if keywords else None
+        extracted_at = datetime.now().isoformat()
+        reddit = self.get_async_connection()
+        try:
+            subreddit_obj = await reddit.subreddit(subreddit)
+            async for post in subreddit_obj.hot(limit=limit):
+                # Filter by keywords if provided
+                if matches and not matches(f"{post.title} {post.selftext}".lower()):
+                    continue
+                results.append(_submission_row(post, keywords or [], extracted_at))
         except Exception as e:
-            raise Exception(f"Error getting comments for submission {submission_id}: {str(e)}")
+            raise Exception(f"Error getting hot posts from r/{subreddit}: {str(e)}")
+        finally:
+            await reddit.close()
         
         return results
 
+    async def aget_comments(self, submission_id: str, limit: int = 100) -> List[Dict]:
+        """
+        Async variant of ``get_comments``.
+        
+        Args:
+            submission_id: ID of the Reddit submission
+            limit: Maximum number of comments to return
+            
+        Returns:
+            List of dictionaries containing comment data
+        """
+        extracted_at = datetime.now().isoformat()
+        reddit = self.get_async_connection()
+        try:
+            submission = await reddit.submission(id=submission_id, fetch=False)
+            submission.comment_limit = min(max(limit, 1), _MAX_COMMENT_LIMIT)
+            await submission.load()
+            await submission.comments.replace_more(limit=0)
+            return [
+                _comment_row(comment, submission, extracted_at)
+                for comment in islice(_iter_comments(submission.comments), limit)
+                if hasattr(comment, "body")
+            ]
+        except Exception as e:
+            raise Exception(f"Error getting comments for submission {submission_id}: {str(e)}")
+        finally:
+            await reddit.close()
+
     def execute(self):
         """Execute method required by BaseHook."""
         pass
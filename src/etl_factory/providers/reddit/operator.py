@@ -1,4 +1,5 @@
-from typing import List, Dict, Optional
+import asyncio
+from typing import Dict, Iterator, List, Optional, Union
 from etl_factory.utils.base import BaseOperator
 from etl_factory.providers.reddit.hook import RedditHook
 
@@ -11,7 +12,8 @@ class RedditOperator(BaseOperator):
 
     def __init__(self, keywords: List[str], subreddit: Optional[str] = None, 
                  limit: int = 100, sort: str = "relevance", operation: str = "search", 
-                 submission_id: Optional[str] = None, **kwargs):
+                 submission_id: Optional[str] = None, use_async: bool = False,
+                 stream: bool = False, **kwargs):
         """
         Initialize the RedditOperator with search parameters.
         
@@ -22,6 +24,9 @@ class RedditOperator(BaseOperator):
             sort: Sort method ("relevance", "hot", "top", "new", "comments")
             operation: Operation to perform ("search", "hot_posts", "comments")
             submission_id: Submission ID (required for comments operation)
+            use_async: Run the request through Async PRAW instead of PRAW
+            stream: Return an iterator that yields rows as they are fetched
+                (sync PRAW only) instead of a list
             **kwargs: Additional keyword arguments passed to BaseOperator
         """
         super().__init__(config_section="REDDIT", **kwargs)
@@ -31,14 +36,17 @@ class RedditOperator(BaseOperator):
         self.sort = sort
         self.operation = operation
         self.submission_id = submission_id
-        self.hook = RedditHook(config_section="REDDIT")
+        self.use_async = use_async
+        self.stream = stream
+        self.hook = RedditHook.from_config(self._config)
 
-    def execute(self) -> List[Dict]:
+    def execute(self) -> Union[List[Dict], Iterator[Dict]]:
         """
         Execute the Reddit data extraction operation.
         
         Returns:
-            List of dictionaries containing Reddit data
+            List of dictionaries containing Reddit data, or an iterator over them
+            when the operator was created with ``stream=True``
             
         Raises:
             ValueError: If operation is not supported or required parameters are missing
@@ -46,7 +54,15 @@ class RedditOperator(BaseOperator):
         if self.operation == "search":
             if not self.keywords:
                 raise ValueError("Keywords are required for search operation")
-            return self.hook.search_submissions(
+            if self.use_async:
+                return asyncio.run(self.hook.asearch_submissions(
+                    keywords=self.keywords,
+                    subreddit=self.subreddit,
+                    limit=self.limit,
+                    sort=self.sort
+                ))
+            search = self.hook.iter_submissions if self.stream else self.hook.search_submissions
+            return search(
                 keywords=self.keywords,
                 subreddit=self.subreddit,
                 limit=self.limit,
@@ -55,7 +71,14 @@ class RedditOperator(BaseOperator):
         elif self.operation == "hot_posts":
             if not self.subreddit:
                 raise ValueError("Subreddit is required for hot_posts operation")
-            return self.hook.get_hot_posts(
+            if self.use_async:
+                return asyncio.run(self.hook.aget_hot_posts(
+                    subreddit=self.subreddit,
+                    limit=self.limit,
+                    keywords=self.keywords
+                ))
+            hot_posts = self.hook.iter_hot_posts if self.stream else self.hook.get_hot_posts
+            return hot_posts(
                 subreddit=self.subreddit,
                 limit=self.limit,
                 keywords=self.keywords
@@ -63,7 +86,13 @@ class RedditOperator(BaseOperator):
         elif self.operation == "comments":
             if not self.submission_id:
                 raise ValueError("Submission ID is required for comments operation")
-            return self.hook.get_comments(
+            if self.use_async:
+                return asyncio.run(self.hook.aget_comments(
+                    submission_id=self.submission_id,
+                    limit=self.limit
+                ))
+            comments = self.hook.iter_comments if self.stream else self.hook.get_comments
+            return comments(
                 submission_id=self.submission_id,
                 limit=self.limit
             )
@@ -1,6 +1,6 @@
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
+from typing import List, Optional, Tuple, Union
 from etl_factory.utils.base import BaseHook
 
 class SMTPHook(BaseHook):
@@ -14,19 +14,81 @@ class SMTPHook(BaseHook):
         self.username = self.get_config("username", section=config_section.lower())
         self.password = self.get_config("password", section=config_section.lower())
         self.use_tls = self.get_config("use_tls", section=config_section.lower()).lower()
+        self._server = None
+        # Nesting depth of ``with hook:`` / ``send_emails`` blocks keeping the connection open
+        self._keep_open = 0
+
+    def __enter__(self):
+        self._keep_open += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._keep_open -= 1
+        if not self._keep_open:
+            self.close()
+
+    def _get_server(self):
+        """
+        Return the open SMTP connection, connecting and logging in on first use.
+
+        Inside ``with hook:`` (or ``send_emails``) the connection is kept for later
+        sends, so the TCP/TLS handshake and login happen once per batch rather than
+        once per email; a standalone ``send_email`` closes it again.
+        """
+        if self._server is None:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            try:
+                if self.use_tls:
+                    server.starttls()
+                server.login(self.username, self.password)
+            except Exception:
+                server.close()
+                raise
+            self._server = server
+        return self._server
+
+    def close(self):
+        """Close the SMTP connection if one is open."""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except smtplib.SMTPServerDisconnected:
+                pass
+            finally:
+                # quit() can fail on a bad QUIT reply; the socket is closed either way
+                self._server.close()
+                self._server = None
 
     def send_email(self, subject, recipients, body, sender=None):
-        msg = MIMEMultipart()
+        msg = EmailMessage()
         msg["From"] = sender or self.username
-        msg["To"] = ", ".join(recipients) if isinstance(recipients, list) else recipients
+        msg["To"] = recipients if isinstance(recipients, str) else ", ".join(recipients)
         msg["Subject"] = subject
-        msg.attach(MIMEText(body, "plain"))
+        msg.set_content(body)
+
+        try:
+            self._get_server().send_message(msg, to_addrs=recipients)
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped the idle connection; reconnect once and retry
+            if self._server is not None:
+                self._server.close()
+            self._server = None
+            self._get_server().send_message(msg, to_addrs=recipients)
+        finally:
+            if not self._keep_open:
+                self.close()
 
-        with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-            if self.use_tls:
-                server.starttls()
-            server.login(self.username, self.password)
-            server.sendmail(msg["From"], recipients, msg.as_string())
+    def send_emails(self, messages: List[Tuple[str, Union[str, List[str]], str]], sender: Optional[str] = None):
+        """
+        Send several emails over one SMTP connection.
+
+        Args:
+            messages: (subject, recipients, body) tuples
+            sender: Sender address (defaults to the configured username)
+        """
+        with self:
+            for subject, recipients, body in messages:
+                self.send_email(subject, recipients, body, sender=sender)
 
     def execute(self):
         pass
\ No newline at end of file
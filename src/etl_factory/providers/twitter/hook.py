@@ -1,34 +1,117 @@
+import asyncio
+import functools
 import logging
+import math
 import tweepy
 from datetime import datetime
-from typing import List, Dict, Optional
+from types import SimpleNamespace
+from typing import List, Dict, Mapping, Optional
 from etl_factory.utils.base import BaseHook
+from etl_factory.utils.common.common import ttl_cached
+
+# Stand-in author for tweets whose user was not expanded into the response includes
+_EMPTY_USER = SimpleNamespace(username=None, name=None, verified=False)
+
+
+def _search_request(keywords: List[str], max_results: int, tweet_fields: Optional[List[str]],
+                    user_fields: Optional[List[str]], expansions: Optional[List[str]]) -> Dict:
+    """Build the search_recent_tweets arguments for a paginated keyword search."""
+    # Default fields to include
+    if tweet_fields is None:
+        tweet_fields = ["created_at", "author_id", "public_metrics", "text", "lang", "possibly_sensitive"]
+    if user_fields is None:
+        user_fields = ["username", "name", "verified", "public_metrics"]
+    if expansions is None:
+        expansions = ["author_id"]
+    per_page = min(max(max_results, 10), 100)  # API accepts 10-100 per request
+    return {
+        "query": " OR ".join(keywords),
+        "max_results": per_page,
+        "tweet_fields": tweet_fields,
+        "user_fields": user_fields,
+        "expansions": expansions,
+        "limit": math.ceil(max_results / per_page)
+    }
+
+
+def _search_rows(tweets, keywords: List[str], extracted_at: str):
+    """Yield the result rows for one page of search results."""
+    if not tweets.data:
+        return
+    # Create a mapping of user_id to user data
+    users = {u.id: u for u in (tweets.includes or {}).get("users", [])}
+    
+    for tweet in tweets.data:
+        u = users.get(tweet.author_id, _EMPTY_USER)
+        pm = getattr(tweet, "public_metrics", None) or {}
+        yield {
+            "tweet_id": tweet.id,
+            "text": tweet.text,
+            "author_id": tweet.author_id,
+            "author_username": u.username,
+            "author_name": u.name,
+            "author_verified": u.verified,
+            "created_at": tweet.created_at.isoformat() if tweet.created_at else None,
+            "lang": tweet.lang if hasattr(tweet, "lang") else None,
+            "retweet_count": pm.get("retweet_count", 0),
+            "like_count": pm.get("like_count", 0),
+            "reply_count": pm.get("reply_count", 0),
+            "quote_count": pm.get("quote_count", 0),
+            "possibly_sensitive": tweet.possibly_sensitive if hasattr(tweet, "possibly_sensitive") else False,
+            "keywords": keywords,
+            "extracted_at": extracted_at
+        }
+
 
-print (BaseHook.get_config(key="bearer_token", section="twitter", fallback=None))
 class TwitterHook(BaseHook):
     """
     Hook for interacting with Twitter API (v2).
     This class extends BaseHook to provide functionality for downloading Twitter data based on keywords.
     """
 
-    def __init__(self, config_section="TWITTER", **kwargs):
+    def __init__(self, config_section="TWITTER", cfg: Optional[Mapping[str, str]] = None, **kwargs):
         """
         Initialize the TwitterHook with Twitter API credentials.
         
         Args:
             config_section: Configuration section name in config file
+            cfg: Already-loaded config section to read the credentials from instead
             **kwargs: Additional keyword arguments
         """
         super().__init__(**kwargs)
+        if cfg is None:
+            section = config_section.lower()
+            cfg = {key: self.get_config(key=key, section=section, fallback=None)
+                   for key in ("bearer_token", "api_key", "api_secret", "access_token", "access_token_secret")}
         # Get config values and treat empty strings as None
-        self.bearer_token = self.get_config(key="bearer_token", section=config_section.lower(), fallback=None)
-        self.api_key = self.get_config(key="api_key", section=config_section.lower(), fallback=None)
-        self.api_secret = self.get_config(key="api_secret", section=config_section.lower(), fallback=None)
-        self.access_token = self.get_config(key="access_token", section=config_section.lower(), fallback=None)
-        self.access_token_secret = self.get_config(key="access_token_secret", section=config_section.lower(), fallback=None)
+        self.bearer_token = cfg.get("bearer_token")
+        self.api_key = cfg.get("api_key")
+        self.api_secret = cfg.get("api_secret")
+        self.access_token = cfg.get("access_token")
+        self.access_token_secret = cfg.get("access_token_secret")
         self.logger = logging.getLogger(__name__)
-        self.logger.info(f"Initializing TwitterHook with config: {self.bearer_token}, {self.api_key}, {self.api_secret}, {self.access_token}, {self.access_token_secret}")
-        self.client = self.get_connection()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Initializing TwitterHook (bearer_token set: {bool(self.bearer_token)}, "
+                              f"api_key set: {bool(self.api_key)})")
+
+    @classmethod
+    def from_config(cls, cfg: Mapping[str, str], **kwargs) -> "TwitterHook":
+        """
+        Create a hook from an already-loaded config section.
+        
+        Args:
+            cfg: Mapping with bearer_token or the OAuth 1.0a key/secret pairs
+            **kwargs: Additional keyword arguments
+            
+        Returns:
+            TwitterHook instance
+        """
+        return cls(cfg=cfg, **kwargs)
+
+    @functools.cached_property
+    def client(self):
+        """Twitter API client, created on first use rather than at construction."""
+        return self.get_connection()
 
     def get_connection(self):
         """
@@ -37,29 +120,32 @@ class TwitterHook(BaseHook):
         Returns:
             tweepy.Client: Twitter API v2 client instance
         """
+        return tweepy.Client(**self._client_params())
+
+    def _cache_identity(self):
+        """Credentials that scope this hook's API cache entries."""
+        return (self.bearer_token, self.api_key, self.access_token)
+
+    def _client_params(self) -> Dict:
+        """Build the credential keyword arguments shared by the sync and async clients."""
         if self.bearer_token:
             # Use bearer token authentication (recommended for v2 API)
-            client = tweepy.Client(
-                bearer_token=self.bearer_token,
-                wait_on_rate_limit=True
-            )
+            return {"bearer_token": self.bearer_token, "wait_on_rate_limit": True}
         elif self.api_key and self.api_secret and self.access_token and self.access_token_secret:
             # Use OAuth 1.0a User Context authentication
-            client = tweepy.Client(
-                consumer_key=api_key,
-                consumer_secret=api_secret,
-                access_token=access_token,
-                access_token_secret=access_token_secret,
-                wait_on_rate_limit=True
-            )
-        else:
-            raise ConnectionError(
-                "Twitter API credentials are required! "
-                "Provide either bearer_token or (api_key, api_secret, access_token, access_token_secret)"
-            )
-        
-        return client
+            return {
+                "consumer_key": self.api_key,
+                "consumer_secret": self.api_secret,
+                "access_token": self.access_token,
+                "access_token_secret": self.access_token_secret,
+                "wait_on_rate_limit": True
+            }
+        raise ConnectionError(
+            "Twitter API credentials are required! "
+            "Provide either bearer_token or (api_key, api_secret, access_token, access_token_secret)"
+        )
 
+    @ttl_cached()
     def search_tweets(self, keywords: List[str], max_results: int = 100, 
                      tweet_fields: Optional[List[str]] = None,
                      user_fields: Optional[List[str]] = None,
@@ -67,9 +153,12 @@ class TwitterHook(BaseHook):
         """
         Search for tweets based on keywords.
         
+        Results are paged through with ``tweepy.Paginator`` (up to 100 tweets per
+        request) until ``max_results`` tweets have been collected.
+        
         Args:
             keywords: List of keywords to search for
-            max_results: Maximum number of results to return (max 100 per request)
+            max_results: Maximum number of results to return
             tweet_fields: Additional tweet fields to include
             user_fields: Additional user fields to include
             expansions: Fields to expand in the response
@@ -77,54 +166,64 @@ class TwitterHook(BaseHook):
         Returns:
             List of dictionaries containing tweet data
         """
-        query = " OR ".join(["btc"])
+        request = _search_request(keywords, max_results, tweet_fields, user_fields, expansions)
+        results = []
+        extracted_at = datetime.now().isoformat()
         
-        # Default fields to include
-        if tweet_fields is None:
-            tweet_fields = ["created_at", "author_id", "public_metrics", "text", "lang", "possibly_sensitive"]
-        if user_fields is None:
-            user_fields = ["username", "name", "verified", "public_metrics"]
-        if expansions is None:
-            expansions = ["author_id"]
+        try:
+            for page in tweepy.Paginator(self.client.search_recent_tweets, **request):
+                results.extend(_search_rows(page, keywords, extracted_at))
+                if len(results) >= max_results:
+                    break
+        except tweepy.TooManyRequests:
+            raise Exception("Twitter API rate limit exceeded. Please wait and try again.")
+        except tweepy.Unauthorized:
+            raise Exception("Twitter API authentication failed. Please check your credentials.")
+        except Exception as e:
+            raise Exception(f"Error searching Twitter tweets: {str(e)}")
+        
+        return results[:max_results]
+
+    def get_async_connection(self):
+        """
+        Create and return an async Twitter API client.
+        
+        Returns:
+            tweepy.asynchronous.AsyncClient: Twitter API v2 async client instance
+        """
+        from tweepy.asynchronous import AsyncClient
+        return AsyncClient(**self._client_params())
+
+    async def asearch_tweets(self, keywords: List[str], max_results: int = 100,
+                             tweet_fields: Optional[List[str]] = None,
+                             user_fields: Optional[List[str]] = None,
+                             expansions: Optional[List[str]] = None, client=None) -> List[Dict]:
+        """
+        Async variant of ``search_tweets``.
         
+        Args:
+            keywords: List of keywords to search for
+            max_results: Maximum number of results to return
+            tweet_fields: Additional tweet fields to include
+            user_fields: Additional user fields to include
+            expansions: Fields to expand in the response
+            client: Open AsyncClient to reuse (a new one is created if None)
+            
+        Returns:
+            List of dictionaries containing tweet data
+        """
+        from tweepy.asynchronous import AsyncPaginator
+        
+        client = client or self.get_async_connection()
+        request = _search_request(keywords, max_results, tweet_fields, user_fields, expansions)
         results = []
+        extracted_at = datetime.now().isoformat()
         
         try:
-            tweets = client.search_recent_tweets(
-                query=query,
-                max_results=min(10, 100),  # API limit is 100 per request
-                tweet_fields=tweet_fields,
-                user_fields=user_fields,
-                expansions=expansions
-            )
-            
-            if tweets.data:
-                # Create a mapping of user_id to user data
-                users = {}
-                if tweets.includes and "users" in tweets.includes:
-                    for user in tweets.includes["users"]:
-                        users[user.id] = user
-                
-                for tweet in tweets.data:
-                    user_data = users.get(tweet.author_id, {})
-                    result = {
-                        "tweet_id": tweet.id,
-                        "text": tweet.text,
-                        "author_id": tweet.author_id,
-                        "author_username": user_data.username if hasattr(user_data, "username") else None,
-                        "author_name": user_data.name if hasattr(user_data, "name") else None,
-                        "author_verified": user_data.verified if hasattr(user_data, "verified") else False,
-                        "created_at": tweet.created_at.isoformat() if tweet.created_at else None,
-                        "lang": tweet.lang if hasattr(tweet, "lang") else None,
-                        "retweet_count": tweet.public_metrics.get("retweet_count", 0) if hasattr(tweet, "public_metrics") and tweet.public_metrics else 0,
-                        "like_count": tweet.public_metrics.get("like_count", 0) if hasattr(tweet, "public_metrics") and tweet.public_metrics else 0,
-                        "reply_count": tweet.public_metrics.get("reply_count", 0) if hasattr(tweet, "public_metrics") and tweet.public_metrics else 0,
-                        "quote_count": tweet.public_metrics.get("quote_count", 0) if hasattr(tweet, "public_metrics") and tweet.public_metrics else 0,
-                        "possibly_sensitive": tweet.possibly_sensitive if hasattr(tweet, "possibly_sensitive") else False,
-                        "keywords": keywords,
-                        "extracted_at": datetime.now().isoformat()
-                    }
-                    results.append(result)
+            async for page in AsyncPaginator(client.search_recent_tweets, **request):
+                results.extend(_search_rows(page, keywords, extracted_at))
+                if len(results) >= max_results:
+                    break
         except tweepy.TooManyRequests:
             raise Exception("Twitter API rate limit exceeded. Please wait and try again.")
         except tweepy.Unauthorized:
@@ -132,8 +231,40 @@ class TwitterHook(BaseHook):
         except Exception as e:
             raise Exception(f"Error searching Twitter tweets: {str(e)}")
         
-        return results
+        return results[:max_results]
+
+    async def asearch_many(self, keyword_groups: List[List[str]], max_results: int = 100,
+                           tweet_fields: Optional[List[str]] = None,
+                           user_fields: Optional[List[str]] = None,
+                           expansions: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Run several tweet searches concurrently over one async client.
+        
+        Args:
+            keyword_groups: Keyword lists, one search per list
+            max_results: Maximum number of results per search
+            tweet_fields: Additional tweet fields to include
+            user_fields: Additional user fields to include
+            expansions: Fields to expand in the response
+            
+        Returns:
+            List of dictionaries containing tweet data, in search order
+        """
+        import aiohttp
+        
+        client = self.get_async_connection()
+        # One pooled session for every request; AsyncClient otherwise opens one per request
+        client.session = aiohttp.ClientSession()
+        try:
+            searches = await asyncio.gather(*(
+                self.asearch_tweets(keywords, max_results, tweet_fields, user_fields, expansions, client=client)
+                for keywords in keyword_groups
+            ))
+        finally:
+            await client.session.close()
+        return [row for rows in searches for row in rows]
 
+    @ttl_cached()
     def get_user_tweets(self, username: str, max_results: int = 100,
                        tweet_fields: Optional[List[str]] = None) -> List[Dict]:
         """
@@ -151,6 +282,7 @@ class TwitterHook(BaseHook):
             tweet_fields = ["created_at", "author_id", "public_metrics", "text", "lang"]
         
         results = []
+        extracted_at = datetime.now().isoformat()
         
         try:
             # Get user ID from username
@@ -169,6 +301,7 @@ class TwitterHook(BaseHook):
             
             if tweets.data:
                 for tweet in tweets.data:
+                    pm = getattr(tweet, "public_metrics", None) or {}
                     result = {
                         "tweet_id": tweet.id,
                         "text": tweet.text,
@@ -176,11 +309,11 @@ class TwitterHook(BaseHook):
                         "author_username": username,
                         "created_at": tweet.created_at.isoformat() if tweet.created_at else None,
                         "lang": tweet.lang if hasattr(tweet, "lang") else None,
-                        "retweet_count": tweet.public_metrics.get("retweet_count", 0) if hasattr(tweet, "public_metrics") and tweet.public_metrics else 0,
-                        "like_count": tweet.public_metrics.get("like_count", 0) if hasattr(tweet, "public_metrics") and tweet.public_metrics else 0,
-                        "reply_count": tweet.public_metrics.get("reply_count", 0) if hasattr(tweet, "public_metrics") and tweet.public_metrics else 0,
-                        "quote_count": tweet.public_metrics.get("quote_count", 0) if hasattr(tweet, "public_metrics") and tweet.public_metrics else 0,
-                        "extracted_at": datetime.now().isoformat()
+                        "retweet_count": pm.get("retweet_count", 0),
+                        "like_count": pm.get("like_count", 0),
+                        "reply_count": pm.get("reply_count", 0),
+                        "quote_count": pm.get("quote_count", 0),
+                        "extracted_at": extracted_at
                     }
                     results.append(result)
         except Exception as e:
@@ -35,7 +35,7 @@ class TwitterOperator(BaseOperator):
         self.tweet_fields = tweet_fields
         self.user_fields = user_fields
         self.expansions = expansions
-        self.hook = TwitterHook(config_section="TWITTER")
+        self.hook = TwitterHook.from_config(self._config)
 
     def execute(self) -> List[Dict]:
         """
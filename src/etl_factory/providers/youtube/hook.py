@@ -1,32 +1,354 @@
+import asyncio
+import functools
+import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
+import requests
 from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from etl_factory.utils.base import BaseHook
+from etl_factory.utils.common.common import cache_key, hook_cache
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Most ids the list endpoints accept in one request
+_MAX_IDS_PER_REQUEST = 50
+
+# search.list returns at most 50 items per page, and stops paging after roughly 10 pages
+_SEARCH_PAGE_SIZE = 50
+_MAX_SEARCH_PAGES = 10
+
+# Channel and video metadata changes slowly; keep cached responses for 3 days by default
+_DEFAULT_CACHE_TTL = 3 * 24 * 60 * 60
+# How long a stale channel entry is kept after its TTL, so its etag can still be revalidated
+_ETAG_RETENTION = 30 * 24 * 60 * 60
+
+# Partial-response masks: only the JSON paths the row builders below read
+_SEARCH_FIELDS = "nextPageToken,items(id/videoId,snippet(title,description,channelId,channelTitle,publishedAt,thumbnails))"
+_CHANNEL_FIELDS = (
+    "etag,items(id,snippet(title,description,country,publishedAt,thumbnails),"
+    "statistics,contentDetails/relatedPlaylists)"
+)
+
+
+# error.errors[].reason values YouTube uses for quota and rate-limit rejections
+_QUOTA_REASONS = {"quotaExceeded", "dailyLimitExceeded", "rateLimitExceeded", "userRateLimitExceeded"}
+
+
+class YouTubeQuotaExceeded(Exception):
+    """Raised when the YouTube Data API keeps rejecting requests for quota or rate limits."""
+
+
+def _is_quota_error(status: int, body: bytes) -> bool:
+    """Whether an error response is a quota/rate-limit rejection rather than a bad request."""
+    if status == 429:
+        return True
+    if status != 403:
+        return False
+    try:
+        errors = _json_loads(body).get("error", {}).get("errors", ())
+    except ValueError:
+        return False
+    return any(error.get("reason") in _QUOTA_REASONS for error in errors)
+
+
+def _search_row(item: Dict, keywords: Tuple[str, ...], extracted_at: str) -> Dict:
+    """Build the result row for a search.list item; every row shares the one ``keywords`` tuple."""
+    snippet = item.get("snippet", {})
+    return {
+        "video_id": item.get("id", {}).get("videoId"),
+        "title": snippet.get("title"),
+        "description": snippet.get("description"),
+        "channel_id": snippet.get("channelId"),
+        "channel_title": snippet.get("channelTitle"),
+        "published_at": snippet.get("publishedAt"),
+        "thumbnails": snippet.get("thumbnails", {}),
+        "keywords": keywords,
+        "extracted_at": extracted_at,
+    }
+
+
+def _channel_row(channel: Dict, extracted_at: str) -> Dict:
+    """Build the result row for a channels.list item."""
+    snippet = channel.get("snippet", {})
+    statistics = channel.get("statistics", {})
+    content_details = channel.get("contentDetails", {})
+
+    return {
+        "channel_id": channel.get("id"),
+        "title": snippet.get("title"),
+        "description": snippet.get("description"),
+        "country": snippet.get("country"),
+        "published_at": snippet.get("publishedAt"),
+        "thumbnails": snippet.get("thumbnails", {}),
+        "statistics": statistics,
+        "related_playlists": content_details.get("relatedPlaylists", {}),
+        "extracted_at": extracted_at,
+    }
+
+
+def _video_row(item: Dict, extracted_at: str) -> Dict:
+    """Build the result row for a videos.list item."""
+    return {
+        "video_id": item.get("id"),
+        "snippet": item.get("snippet", {}),
+        "statistics": item.get("statistics", {}),
+        "content_details": item.get("contentDetails", {}),
+        "extracted_at": extracted_at,
+    }
+
+
+def _video_fields(part: str) -> str:
+    """Partial-response mask for videos.list covering the requested parts."""
+    return f"items(id,{part})"
+
+
+def _parse_rfc3339(value: str) -> datetime:
+    """Parse an RFC 3339 timestamp such as ``2024-01-01T00:00:00Z``."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _split_timerange(published_after: str, published_before: str, bins: int) -> List[Tuple[str, str]]:
+    """Split a publish window into ``bins`` equal sub-windows, newest first."""
+    start = _parse_rfc3339(published_after)
+    step = (_parse_rfc3339(published_before) - start) / bins
+    bounds = [
+        (start + step * i).astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        for i in range(bins + 1)
+    ]
+    bounds[0], bounds[-1] = published_after, published_before
+    return [(bounds[i], bounds[i + 1]) for i in reversed(range(bins))]
+
+
+def _search_shards(params: Dict[str, object], max_results: int) -> List[Dict[str, object]]:
+    """
+    Split a search into time-range shards when more than one page is wanted.
+
+    Each shard covers an equal slice of the publishedAfter/publishedBefore window, so
+    they can be fetched concurrently; without both bounds the search is one shard.
+    """
+    after, before = params.get("publishedAfter"), params.get("publishedBefore")
+    if max_results <= _SEARCH_PAGE_SIZE or not (after and before):
+        return [params]
+    bins = math.ceil(max_results / _SEARCH_PAGE_SIZE)
+    return [
+        dict(params, publishedAfter=bin_after, publishedBefore=bin_before)
+        for bin_after, bin_before in _split_timerange(after, before, bins)
+    ]
+
+
+def _dedupe_videos(items: List[Dict], max_results: int) -> List[Dict]:
+    """Drop search items already seen under another shard and cap the total."""
+    unique = {}
+    for item in items:
+        unique.setdefault(item.get("id", {}).get("videoId"), item)
+    return list(unique.values())[:max_results]
+
+
+def _unique_count(pages: List[List[Dict]]) -> int:
+    """Count the distinct videos across per-shard search results."""
+    return len({item.get("id", {}).get("videoId") for page in pages for item in page})
+
+
+def _batches(ids: List[str]) -> List[List[str]]:
+    """Split ids into chunks the list endpoints accept in one request."""
+    return [ids[i:i + _MAX_IDS_PER_REQUEST] for i in range(0, len(ids), _MAX_IDS_PER_REQUEST)]
 
 
 class YouTubeHook(BaseHook):
     """Hook for interacting with the YouTube Data API v3."""
 
+    _BASE_URL = "https://www.googleapis.com/youtube/v3"
+    _SEARCH_URL = f"{_BASE_URL}/search"
+    _CHANNELS_URL = f"{_BASE_URL}/channels"
+    _VIDEOS_URL = f"{_BASE_URL}/videos"
+    # Fixed search.list parameters; each call copies them and adds the query-specific ones
+    _BASE_SEARCH_PARAMS = {"part": "snippet", "fields": _SEARCH_FIELDS, "type": "video", "order": "date"}
+    _CHANNEL_PARAMS = {"part": "snippet,statistics,contentDetails", "fields": _CHANNEL_FIELDS}
+    # googleapiclient clients shared by every hook in the process, keyed by API key
+    _CLIENTS: Dict[str, object] = {}
+
     def __init__(self, config_section: str = "YOUTUBE", **kwargs):
         """Initialize the YouTube hook with API credentials."""
         super().__init__(**kwargs)
-        self.api_key = self.get_config(key="api_key", section=config_section.lower(), fallback=None)
-        if not self.api_key:
-            raise ValueError("YouTube API key is required")
+        self.config_section = config_section.lower()
+        self.cache_ttl = int(self.get_config(key="cache_ttl", section=self.config_section, fallback=_DEFAULT_CACHE_TTL))
 
         self.logger = logging.getLogger(__name__)
-        self.client = self.get_connection()
+        # Pooled keep-alive session: requests reuse connections instead of a new TLS handshake each
+        self._session = requests.Session()
+        # Transient 429/5xx responses are retried with exponential backoff, honouring Retry-After
+        retries = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=["GET"],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries))
+
+    @functools.cached_property
+    def api_key(self) -> str:
+        """API key from the config section, looked up on first use."""
+        api_key = self.get_config(key="api_key", section=self.config_section, fallback=None)
+        if not api_key:
+            raise ValueError("YouTube API key is required")
+        return api_key
+
+    def _cache_identity(self):
+        """Credentials that scope this hook's API cache entries."""
+        return (self.api_key,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        self._session.close()
+
+    @functools.cached_property
+    def client(self):
+        """googleapiclient client for endpoints not covered by the REST helpers, built on first use."""
+        return self.get_connection()
 
     def get_connection(self):
-        """Create a YouTube API client."""
-        try:
-            return build("youtube", "v3", developerKey=self.api_key)
-        except Exception as exc:
-            raise ConnectionError("Failed to initialize YouTube API client") from exc
+        """
+        Return a googleapiclient YouTube API client.
+
+        The client is built from the discovery document bundled with
+        googleapiclient (no download) and shared by every hook using the same key.
+        """
+        client = self._CLIENTS.get(self.api_key)
+        if client is None:
+            try:
+                client = build(
+                    "youtube", "v3", developerKey=self.api_key, static_discovery=True, cache_discovery=False
+                )
+            except Exception as exc:
+                raise ConnectionError("Failed to initialize YouTube API client") from exc
+            client = self._CLIENTS.setdefault(self.api_key, client)
+        return client
+
+    def _send(self, url: str, params: Dict[str, object], headers: Optional[Dict[str, str]] = None):
+        """
+        GET a YouTube Data API endpoint over the pooled session, raising on error statuses.
+
+        Raises:
+            YouTubeQuotaExceeded: If the request is still rejected for quota or rate
+                limits once the session's retries are exhausted
+        """
+        response = self._session.get(url, params={**params, "key": self.api_key}, headers=headers, timeout=10)
+        if _is_quota_error(response.status_code, response.content):
+            raise YouTubeQuotaExceeded(f"YouTube API quota or rate limit exceeded ({response.status_code})")
+        response.raise_for_status()
+        return response
+
+    def _get(self, url: str, params: Dict[str, object]) -> Dict:
+        """GET a YouTube Data API endpoint and decode the JSON body."""
+        return _json_loads(self._send(url, params).content)
+
+    async def _aget(self, session, url: str, params: Dict[str, object]) -> Dict:
+        """Async counterpart of ``_get`` on an ``aiohttp.ClientSession``."""
+        async with session.get(
+            url,
+            params={**params, "key": self.api_key},
+            timeout=aiohttp.ClientTimeout(total=10),
+        ) as response:
+            body = await response.read()
+            if _is_quota_error(response.status, body):
+                raise YouTubeQuotaExceeded(f"YouTube API quota or rate limit exceeded ({response.status})")
+            response.raise_for_status()
+            return _json_loads(body)
+
+    @staticmethod
+    def _client_session():
+        """Open an aiohttp session for one batch of async requests."""
+        if aiohttp is None:
+            raise ImportError("aiohttp package not installed. Install with: pip install aiohttp")
+        return aiohttp.ClientSession()
+
+    @classmethod
+    def _search_params(
+        cls,
+        keywords: List[str],
+        max_results: int,
+        published_after: Optional[str],
+        published_before: Optional[str],
+        region_code: Optional[str],
+    ) -> Dict[str, object]:
+        """Build the search.list query parameters."""
+        params: Dict[str, object] = dict(
+            cls._BASE_SEARCH_PARAMS,
+            q=" ".join(keywords),
+            maxResults=min(max_results, _SEARCH_PAGE_SIZE),  # API limit is 50
+        )
+
+        if published_after:
+            params["publishedAfter"] = published_after
+        if published_before:
+            params["publishedBefore"] = published_before
+        if region_code:
+            params["regionCode"] = region_code
+        return params
+
+    def _search_pages(self, params: Dict[str, object], limit: int, page_token: Optional[str] = None,
+                      max_pages: int = _MAX_SEARCH_PAGES) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Follow nextPageToken for one search until ``limit`` items or ``max_pages`` pages.
+
+        Returns the items and the token of the next unread page (None when exhausted).
+        """
+        items: List[Dict] = []
+        page_params = dict(params)
+        token = page_token
+        for _ in range(max_pages):
+            if token:
+                page_params["pageToken"] = token
+            page_params["maxResults"] = min(limit - len(items), _SEARCH_PAGE_SIZE)
+            response = self._get(self._SEARCH_URL, page_params)
+            items.extend(response.get("items", ()))
+            token = response.get("nextPageToken")
+            if not token or len(items) >= limit:
+                break
+        return items, token
+
+    async def _asearch_pages(self, session, params: Dict[str, object], limit: int,
+                             page_token: Optional[str] = None,
+                             max_pages: int = _MAX_SEARCH_PAGES) -> Tuple[List[Dict], Optional[str]]:
+        """Async counterpart of ``_search_pages``."""
+        items: List[Dict] = []
+        page_params = dict(params)
+        token = page_token
+        for _ in range(max_pages):
+            if token:
+                page_params["pageToken"] = token
+            page_params["maxResults"] = min(limit - len(items), _SEARCH_PAGE_SIZE)
+            response = await self._aget(session, self._SEARCH_URL, page_params)
+            items.extend(response.get("items", ()))
+            token = response.get("nextPageToken")
+            if not token or len(items) >= limit:
+                break
+        return items, token
 
     def search_videos(
         self,
@@ -36,105 +358,227 @@ class YouTubeHook(BaseHook):
         published_before: Optional[str] = None,
         region_code: Optional[str] = None,
     ) -> List[Dict]:
-        """Search for YouTube videos matching the specified keywords."""
-        query = " ".join(keywords)
-        params: Dict[str, object] = {
-            "q": query,
-            "part": "snippet",
-            "type": "video",
-            "order": "date",
-            "maxResults": min(max_results, 50),  # API limit is 50
-        }
+        """
+        Search for YouTube videos matching the specified keywords.
 
-        if published_after:
-            params["publishedAfter"] = published_after
-        if published_before:
-            params["publishedBefore"] = published_before
-        if region_code:
-            params["regionCode"] = region_code
+        More than 50 results are collected by following nextPageToken. When both
+        ``published_after`` and ``published_before`` are given, the window is first
+        split into one time range per 50 results and the ranges are searched
+        concurrently. If the first pages fall short of ``max_results`` (a few busy
+        ranges, many quiet ones), the busy ranges are then paged further, newest
+        first, up to 10 pages each.
+        """
+        params = self._search_params(keywords, max_results, published_after, published_before, region_code)
+        shards = _search_shards(params, max_results)
+        per_shard = math.ceil(max_results / len(shards))
 
         try:
-            response = self.client.search().list(**params).execute()
-        except HttpError as exc:
+            with ThreadPoolExecutor(max_workers=min(8, len(shards))) as executor:
+                results = list(executor.map(lambda shard: self._search_pages(shard, per_shard), shards))
+            pages = [items for items, _ in results]
+            if len(shards) > 1:
+                for index, (shard, (_, token)) in enumerate(zip(shards, results)):
+                    missing = max_results - _unique_count(pages)
+                    if missing <= 0:
+                        break
+                    if token:
+                        more, _ = self._search_pages(shard, missing, token, _MAX_SEARCH_PAGES - 1)
+                        pages[index] = pages[index] + more
+        except requests.RequestException as exc:
             raise Exception(f"YouTube API search error: {exc}") from exc
 
-        results: List[Dict] = []
-        for item in response.get("items", []):
-            snippet = item.get("snippet", {})
-            results.append(
-                {
-                    "video_id": item.get("id", {}).get("videoId"),
-                    "title": snippet.get("title"),
-                    "description": snippet.get("description"),
-                    "channel_id": snippet.get("channelId"),
-                    "channel_title": snippet.get("channelTitle"),
-                    "published_at": snippet.get("publishedAt"),
-                    "thumbnails": snippet.get("thumbnails", {}),
-                    "keywords": keywords,
-                    "extracted_at": datetime.utcnow().isoformat(),
-                }
-            )
+        extracted_at = datetime.now(timezone.utc).isoformat()
+        keywords = tuple(keywords)  # one immutable copy shared by every row
+        items = _dedupe_videos([item for page in pages for item in page], max_results)
+        return [_search_row(item, keywords, extracted_at) for item in items]
+
+    async def asearch_videos(
+        self,
+        keywords: List[str],
+        max_results: int = 50,
+        published_after: Optional[str] = None,
+        published_before: Optional[str] = None,
+        region_code: Optional[str] = None,
+        session=None,
+    ) -> List[Dict]:
+        """Async variant of ``search_videos``; pass ``session`` to share an aiohttp session."""
+        params = self._search_params(keywords, max_results, published_after, published_before, region_code)
+        shards = _search_shards(params, max_results)
+        per_shard = math.ceil(max_results / len(shards))
+
+        own_session = session is None
+        session = session or self._client_session()
+        try:
+            results = await asyncio.gather(*(self._asearch_pages(session, shard, per_shard) for shard in shards))
+            pages = [items for items, _ in results]
+            if len(shards) > 1:
+                for index, (shard, (_, token)) in enumerate(zip(shards, results)):
+                    missing = max_results - _unique_count(pages)
+                    if missing <= 0:
+                        break
+                    if token:
+                        more, _ = await self._asearch_pages(session, shard, missing, token, _MAX_SEARCH_PAGES - 1)
+                        pages[index] = pages[index] + more
+        except aiohttp.ClientError as exc:
+            raise Exception(f"YouTube API search error: {exc}") from exc
+        finally:
+            if own_session:
+                await session.close()
 
-        return results
+        extracted_at = datetime.now(timezone.utc).isoformat()
+        keywords = tuple(keywords)  # one immutable copy shared by every row
+        items = _dedupe_videos([item for page in pages for item in page], max_results)
+        return [_search_row(item, keywords, extracted_at) for item in items]
 
     def get_channel_statistics(self, channel_id: str) -> Dict:
-        """Fetch summary information for a single YouTube channel."""
+        """
+        Fetch summary information for a single YouTube channel.
+
+        The channel resource is cached on disk with its etag. Within ``cache_ttl`` it
+        is served without a request; after that it is revalidated with
+        ``If-None-Match``, and a 304 Not Modified keeps the cached copy for another
+        ``cache_ttl``.
+        """
+        cache = hook_cache(self)
+        key = cache_key(self, "channel", channel_id)
+        entry = cache.get(key) if cache is not None else None
+        if entry is not None and entry["fresh_until"] > time.time():
+            return _channel_row(entry["item"], datetime.now(timezone.utc).isoformat())
+
+        headers = {"If-None-Match": entry["etag"]} if entry and entry["etag"] else None
         try:
-            response = (
-                self.client.channels()
-                .list(id=channel_id, part="snippet,statistics,contentDetails")
-                .execute()
+            response = self._send(self._CHANNELS_URL, dict(self._CHANNEL_PARAMS, id=channel_id), headers)
+        except requests.RequestException as exc:
+            raise Exception(f"YouTube API channel lookup error: {exc}") from exc
+
+        if response.status_code == 304:
+            item, etag = entry["item"], entry["etag"]
+        else:
+            body = _json_loads(response.content)
+            if not body.get("items"):
+                raise ValueError(f"Channel {channel_id} not found")
+            item, etag = body["items"][0], response.headers.get("ETag") or body.get("etag")
+
+        if cache is not None:
+            cache.set(
+                key,
+                {"etag": etag, "item": item, "fresh_until": time.time() + self.cache_ttl},
+                expire=self.cache_ttl + _ETAG_RETENTION,
             )
-        except HttpError as exc:
+        return _channel_row(item, datetime.now(timezone.utc).isoformat())
+
+    async def aget_channel_statistics_many(self, channel_ids: List[str]) -> List[Dict]:
+        """
+        Fetch summary information for many channels concurrently.
+
+        The ids are requested 50 at a time (the channels.list limit) and the batches
+        are gathered over one aiohttp session. Channels that do not exist are omitted.
+        """
+        if not channel_ids:
+            return []
+
+        session = self._client_session()
+        try:
+            responses = await asyncio.gather(*(
+                self._aget(session, self._CHANNELS_URL, dict(self._CHANNEL_PARAMS, id=",".join(batch)))
+                for batch in _batches(channel_ids)
+            ))
+        except aiohttp.ClientError as exc:
             raise Exception(f"YouTube API channel lookup error: {exc}") from exc
+        finally:
+            await session.close()
+
+        extracted_at = datetime.now(timezone.utc).isoformat()
+        return [
+            _channel_row(channel, extracted_at)
+            for response in responses
+            for channel in response.get("items", ())
+        ]
+
+    def get_channel_statistics_many(self, channel_ids: List[str]) -> List[Dict]:
+        """Blocking wrapper around ``aget_channel_statistics_many``."""
+        return asyncio.run(self.aget_channel_statistics_many(channel_ids))
+
+    def _cached_videos(self, video_ids: List[str], part: str):
+        """
+        Split ``video_ids`` into rows already in the API cache and ids still to fetch.
 
-        if not response.get("items"):
-            raise ValueError(f"Channel {channel_id} not found")
-
-        channel = response["items"][0]
-        snippet = channel.get("snippet", {})
-        statistics = channel.get("statistics", {})
-        content_details = channel.get("contentDetails", {})
-
-        return {
-            "channel_id": channel.get("id"),
-            "title": snippet.get("title"),
-            "description": snippet.get("description"),
-            "country": snippet.get("country"),
-            "published_at": snippet.get("publishedAt"),
-            "thumbnails": snippet.get("thumbnails", {}),
-            "statistics": statistics,
-            "related_playlists": content_details.get("relatedPlaylists", {}),
-            "extracted_at": datetime.utcnow().isoformat(),
-        }
-
-    def get_video_details(self, video_ids: List[str], parts: Optional[List[str]] = None) -> List[Dict]:
-        """Retrieve detailed metadata for one or more videos."""
+        Rows are cached per (id, part), so a partially cached batch only requests the
+        ids that are missing.
+        """
+        cache = hook_cache(self)
+        cached: Dict[str, Dict] = {}
+        if cache is not None:
+            for video_id in video_ids:
+                row = cache.get(cache_key(self, "video", video_id, part))
+                if row is not None:
+                    cached[video_id] = row
+        missing = [video_id for video_id in dict.fromkeys(video_ids) if video_id not in cached]
+        return cached, missing
+
+    def _store_videos(self, items: List[Dict], part: str, rows: Dict[str, Dict]) -> None:
+        """Build rows for freshly fetched items, adding them to ``rows`` and the API cache."""
+        cache = hook_cache(self)
+        extracted_at = datetime.now(timezone.utc).isoformat()
+        for item in items:
+            row = _video_row(item, extracted_at)
+            rows[row["video_id"]] = row
+            if cache is not None:
+                cache.set(cache_key(self, "video", row["video_id"], part), row, expire=self.cache_ttl)
+
+    def get_video_details(
+        self, video_ids: List[str], parts: Optional[List[str]] = None, max_workers: int = 4
+    ) -> List[Dict]:
+        """
+        Retrieve detailed metadata for one or more videos.
+
+        Rows are served from the on-disk API cache when present; the remaining ids are
+        requested 50 at a time (the videos.list limit), with the batches fetched
+        concurrently on up to ``max_workers`` threads.
+        """
         if not video_ids:
             return []
 
         part = ",".join(parts) if parts else "snippet,statistics,contentDetails"
+        fields = _video_fields(part)
+        rows, missing = self._cached_videos(video_ids, part)
+        batches = _batches(missing)
+
+        def fetch(batch: List[str]) -> List[Dict]:
+            return self._get(self._VIDEOS_URL, {"id": ",".join(batch), "part": part, "fields": fields}).get("items", ())
 
         try:
-            response = (
-                self.client.videos().list(id=",".join(video_ids), part=part).execute()
-            )
-        except HttpError as exc:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(batches)))) as executor:
+                items = [item for batch_items in executor.map(fetch, batches) for item in batch_items]
+        except requests.RequestException as exc:
             raise Exception(f"YouTube API video detail error: {exc}") from exc
 
-        video_details: List[Dict] = []
-        for item in response.get("items", []):
-            video_details.append(
-                {
-                    "video_id": item.get("id"),
-                    "snippet": item.get("snippet", {}),
-                    "statistics": item.get("statistics", {}),
-                    "content_details": item.get("contentDetails", {}),
-                    "extracted_at": datetime.utcnow().isoformat(),
-                }
-            )
+        self._store_videos(items, part, rows)
+        return [rows[video_id] for video_id in dict.fromkeys(video_ids) if video_id in rows]
+
+    async def aget_video_details(self, video_ids: List[str], parts: Optional[List[str]] = None) -> List[Dict]:
+        """Async variant of ``get_video_details``, gathering every 50-id batch over one aiohttp session."""
+        if not video_ids:
+            return []
+
+        part = ",".join(parts) if parts else "snippet,statistics,contentDetails"
+        fields = _video_fields(part)
+        rows, missing = self._cached_videos(video_ids, part)
+
+        if missing:
+            session = self._client_session()
+            try:
+                responses = await asyncio.gather(*(
+                    self._aget(session, self._VIDEOS_URL, {"id": ",".join(batch), "part": part, "fields": fields})
+                    for batch in _batches(missing)
+                ))
+            except aiohttp.ClientError as exc:
+                raise Exception(f"YouTube API video detail error: {exc}") from exc
+            finally:
+                await session.close()
+            self._store_videos([item for response in responses for item in response.get("items", ())], part, rows)
 
-        return video_details
+        return [rows[video_id] for video_id in dict.fromkeys(video_ids) if video_id in rows]
 
     def execute(self):
         """Execute method required by BaseHook."""
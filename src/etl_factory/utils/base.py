@@ -1,3 +1,4 @@
+import functools
 from etl_factory.config.config_loader import config
 from abc import ABC, abstractmethod
 
@@ -22,8 +23,7 @@ class BaseHook(Base, ABC):
             **kwargs: Arbitrary keyword arguments to set as attributes of the hook.
         """
         super().__init__(**kwargs)
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+
     @abstractmethod
     def execute(self):
         """
@@ -50,6 +50,11 @@ class BaseOperator(Base, ABC):
         super().__init__(**kwargs)
         self.params = kwargs
 
+    @functools.cached_property
+    def _config(self):
+        """This operator's config section, read once so it can be handed to its hook."""
+        return config.get_section(self.config_section.lower())
+
     @abstractmethod
     def execute(self):
         """
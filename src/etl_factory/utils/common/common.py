@@ -0,0 +1,84 @@
+"""
+Helpers shared by the provider hooks.
+"""
+import functools
+import hashlib
+import os
+
+# Per-user location (like the LLM response cache), never a shared temp directory
+API_CACHE_DIR = os.path.expanduser("~/.cache/etl_factory/api")
+
+
+@functools.lru_cache(maxsize=1)
+def get_api_cache():
+    """
+    Return the process-wide on-disk cache for API responses.
+
+    The directory is created readable by the current user only, since entries are
+    pickled and may hold account-specific results.
+
+    Returns:
+        diskcache.Cache instance, or None if diskcache is not installed
+    """
+    try:
+        from diskcache import Cache
+    except ImportError:
+        print("Warning: diskcache package not installed. Install with: pip install diskcache")
+        return None
+    os.makedirs(API_CACHE_DIR, mode=0o700, exist_ok=True)
+    os.chmod(API_CACHE_DIR, 0o700)
+    return Cache(API_CACHE_DIR, size_limit=2 << 30)
+
+
+def hook_cache(hook):
+    """
+    Return the API cache for a hook that opted in with ``use_cache=True``.
+
+    Returns:
+        diskcache.Cache instance, or None when caching is off or unavailable
+    """
+    return get_api_cache() if getattr(hook, "use_cache", False) else None
+
+
+def cache_key(hook, *parts) -> tuple:
+    """
+    Build an API cache key scoped to the hook's credentials.
+
+    Hooks define ``_cache_identity()`` returning the values that identify the
+    account (keys, usernames); they are hashed so no secret is stored in the key.
+    Hooks without it only share entries with themselves.
+    """
+    identity = getattr(hook, "_cache_identity", None)
+    if identity is None:
+        scope = f"instance-{id(hook)}"
+    else:
+        scope = hashlib.sha256(repr(identity()).encode()).hexdigest()
+    return (type(hook).__name__, scope) + parts
+
+
+def ttl_cached(ttl: int = 300):
+    """
+    Cache a hook method's result on disk for ``ttl`` seconds.
+
+    Caching is opt-in: only hooks created with ``use_cache=True`` use it, so
+    polling callers keep getting live results by default. Entries are keyed on the
+    hook class, its credentials (see ``cache_key``), the method name and the call
+    arguments. A hook with a ``cache_ttl`` attribute uses it in place of ``ttl``.
+
+    Args:
+        ttl: Default number of seconds a cached result stays valid
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = hook_cache(self)
+            if cache is None:
+                return method(self, *args, **kwargs)
+            key = cache_key(self, method.__name__, args, tuple(sorted(kwargs.items())))
+            result = cache.get(key)
+            if result is None:
+                result = method(self, *args, **kwargs)
+                cache.set(key, result, expire=getattr(self, "cache_ttl", None) or ttl)
+            return result
+        return wrapper
+    return decorator